@@ -1,6 +1,13 @@
 #importar la libreria math para usar funciones matemáticas:
 
 import math
+from concurrent.futures import ThreadPoolExecutor
+
+#numpy es opcional: solo lo necesitan las variantes por lotes:
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 def biseccion(f, a, b, er, n, mostrar_proceso=True):
     """Algoritmo de biseccion
@@ -103,6 +110,398 @@ def biseccion(f, a, b, er, n, mostrar_proceso=True):
     #Si el bucle termina, retornaremos la mejor aproximación y el error alcanzado:
     return m_actual, ei
 
+def _evaluar_vectorizado(f, x):
+    """Evalua f sobre un arreglo de numpy.
+    Si f acepta arreglos se hace una sola llamada; si no, se evalua punto a punto.
+
+    Args:
+        f (callable): funcion objetivo.
+        x (numpy.ndarray): puntos donde se evalua f.
+
+    Returns:
+        numpy.ndarray: valores f(x) con la misma forma que x.
+    """
+    try:
+        fx = np.asarray(f(x), dtype=float)
+        if fx.shape == x.shape:
+            return fx
+    except (TypeError, ValueError):
+        pass
+    #f solo trabaja con escalares (por ejemplo usa math.exp):
+    return np.fromiter((f(float(xi)) for xi in x.ravel()), dtype=float, count=x.size).reshape(x.shape)
+
+
+def biseccion_lote(f, a, b, er, n):
+    """Algoritmo de biseccion sobre muchos intervalos a la vez.
+    Cada intervalo [a_i, b_i] se biseca en paralelo con operaciones de numpy;
+    los intervalos que ya convergieron se congelan con una mascara y f se
+    llama una sola vez por iteracion sobre los intervalos activos.
+
+    Args:
+        f (callable): funcion objetivo. Si acepta arreglos de numpy se evalua
+            de forma vectorizada; si no, se evalua punto a punto.
+        a, b (array_like): extremos iniciales de cada intervalo.
+        er (float): error relativo maximo permitido.
+        n (int): numero maximo de iteraciones.
+
+    Returns:
+        tuple: `(raices, errores, iteraciones)` como arreglos de numpy.
+    """
+    if np is None:
+        raise ImportError("biseccion_lote requiere numpy.")
+
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    a = a.ravel().copy()
+    b = b.ravel().copy()
+    fa = _evaluar_vectorizado(f, a)
+    fb = _evaluar_vectorizado(f, b)
+
+    #Misma validacion que la version escalar: todos los intervalos deben cambiar de signo:
+    if np.any(fa * fb > 0):
+        raise ValueError("La funcion no cambia de signo en el intervalo dado.")
+
+    raices = (a + b) / 2
+    errores = np.ones_like(a)
+    iteraciones = np.zeros(a.shape, dtype=int)
+    m_anterior = np.full_like(a, np.nan)
+    activos = np.ones(a.shape, dtype=bool)
+
+    #Si un extremo ya es raiz, ese intervalo termina antes de iterar:
+    en_b = fb == 0
+    en_a = fa == 0
+    raices[en_b] = b[en_b]
+    raices[en_a] = a[en_a]
+    errores[en_a | en_b] = 0.0
+    activos[en_a | en_b] = False
+
+    i = 0
+    while i < n and activos.any():
+        idx = np.flatnonzero(activos)
+        m_actual = (a[idx] + b[idx]) / 2
+        fm = _evaluar_vectorizado(f, m_actual)
+
+        #Error relativo respecto al punto medio anterior (la primera iteracion no lo tiene):
+        previo = m_anterior[idx]
+        con_previo = ~np.isnan(previo)
+        cambio = np.abs(m_actual - previo)
+        divisor = np.where(m_actual != 0, np.abs(m_actual), 1.0)
+        ei = np.where(con_previo, cambio / divisor, errores[idx])
+
+        #Elegimos el subintervalo que conserva el cambio de signo:
+        izquierda = fa[idx] * fm < 0
+        derecha = ~izquierda & (fm * fb[idx] < 0)
+        exacta = ~izquierda & ~derecha
+
+        b[idx[izquierda]] = m_actual[izquierda]
+        fb[idx[izquierda]] = fm[izquierda]
+        a[idx[derecha]] = m_actual[derecha]
+        fa[idx[derecha]] = fm[derecha]
+
+        ei[exacta] = 0.0
+        raices[idx] = m_actual
+        errores[idx] = ei
+        m_anterior[idx] = m_actual
+        iteraciones[idx] += ~exacta
+
+        #Congelamos los intervalos que convergieron o encontraron la raiz exacta:
+        activos[idx[exacta | (ei <= er)]] = False
+        i += 1
+
+    return raices, errores, iteraciones
+
+def brent(f, a, b, er, n, mostrar_proceso=True):
+    """Algoritmo de Brent (biseccion + secante + interpolacion cuadratica inversa).
+    Mantiene siempre un intervalo con cambio de signo como la biseccion, pero
+    intenta pasos de interpolacion cuando son seguros. Evalua f una sola vez
+    por iteracion.
+
+    Args:
+        f (callable): funcion objetivo.
+        a, b (float): extremos iniciales del intervalo donde se cree que hay una raiz.
+        er (float): error relativo maximo permitido (semiancho del intervalo / |raiz|).
+        n (int): numero maximo de iteraciones.
+        mostrar_proceso (bool): si es True, muestra el proceso de calculo paso a paso.
+
+    Returns:
+        tuple: par `(raiz_aproximada, error_final)`.
+    """
+    fa = f(a)
+    fb = f(b)
+
+    #Validacion que exista cambio de signo en el intervalo:
+    if fa * fb > 0:
+        raise ValueError("La funcion no cambia de signo en el intervalo dado.")
+
+    if mostrar_proceso:
+        print("\n" + "="*70)
+        print("MÉTODO DE BRENT")
+        print("="*70)
+        print(f"Intervalo inicial: [a, b] = [{a}, {b}]")
+        print(f"Error máximo permitido (er): {er}")
+        print(f"Número máximo de iteraciones (n): {n}")
+        print(f"f(a) = {fa:.7f}")
+        print(f"f(b) = {fb:.7f}")
+        print("-"*70)
+        print(f"{'Iter':<6} {'b':<15} {'f(b)':<15} {'Paso':<15} {'Error':<15}")
+        print("-"*70)
+
+    #b es la mejor aproximacion, c el extremo opuesto del intervalo y a el valor anterior de b:
+    c, fc = a, fa
+    d = e = b - a
+    ei = 1.0
+    i = 0
+    paso = "-"
+    eps = 2.0 ** -52
+
+    while i < n:
+        #Si b y c quedaron del mismo lado, recuperamos el intervalo con a:
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        #Mantenemos en b el punto con menor |f|:
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        xm = (c - b) / 2
+        ei = abs(xm / b) if b != 0 else abs(xm)
+
+        if mostrar_proceso:
+            print(f"{i:<6} {b:<15.7f} {fb:<15.7f} {paso:<15} {ei:<15.7f}")
+
+        if fb == 0:
+            if mostrar_proceso:
+                print(f"        ¡Raíz exacta encontrada! f(b) = 0")
+                print("-"*70)
+            return b, 0.0
+        if ei <= er:
+            break
+
+        #Paso minimo para no estancarse cerca de la raiz:
+        tol1 = 2 * eps * abs(b) + 0.5 * er * abs(b) if b != 0 else er
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                #Solo hay dos puntos distintos: secante.
+                p = 2 * xm * s
+                q = 1 - s
+                paso = "secante"
+            else:
+                #Interpolacion cuadratica inversa con a, b y c:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * xm * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+                paso = "interpolación"
+            if p > 0:
+                q = -q
+            p = abs(p)
+            #Aceptamos la interpolacion solo si cae dentro del intervalo y reduce lo suficiente:
+            if 2 * p < min(3 * xm * q - abs(tol1 * q), abs(e * q)):
+                e = d
+                d = p / q
+            else:
+                d = xm
+                e = d
+                paso = "bisección"
+        else:
+            d = xm
+            e = d
+            paso = "bisección"
+
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else math.copysign(tol1, xm)
+        fb = f(b)
+        i += 1
+
+    # Mostramos resumen final:
+    if mostrar_proceso:
+        print("-"*70)
+        if ei <= er:
+            print(f"\n✓ Convergencia alcanzada en {i} iteraciones")
+        else:
+            print(f"\n⚠ Límite de iteraciones alcanzado ({n} iteraciones)")
+        print(f"Raíz aproximada: {b:.7f}")
+        print(f"Error relativo final: {ei:.7f}")
+        print("="*70)
+
+    return b, ei
+
+def buscar_raices(f, a, b, puntos=10001, er=1e-10, n=100, subdividir=0):
+    """Busca todas las raices de f en [a, b] sin conocer intervalos previos.
+    Muestrea f en una malla uniforme (una sola llamada vectorizada), toma cada
+    celda con cambio de signo como intervalo y los refina todos a la vez con
+    `biseccion_lote`.
+
+    Args:
+        f (callable): funcion objetivo (preferiblemente compatible con numpy).
+        a, b (float): extremos del dominio de busqueda.
+        puntos (int): numero de puntos de la malla de muestreo.
+        er (float): error relativo maximo permitido en el refinamiento.
+        n (int): numero maximo de iteraciones de biseccion.
+        subdividir (int): si es mayor que cero, las celdas alrededor de cada
+            extremo local sin cambio de signo se subdividen en ese numero de
+            partes para detectar pares de raices muy cercanas.
+
+    Returns:
+        numpy.ndarray: raices encontradas, ordenadas de menor a mayor.
+    """
+    if np is None:
+        raise ImportError("buscar_raices requiere numpy.")
+
+    x = np.linspace(a, b, puntos)
+    fx = _evaluar_vectorizado(f, x)
+
+    #Los puntos de la malla donde f vale exactamente cero ya son raices:
+    raices = [x[fx == 0]]
+
+    #Celdas con cambio de signo:
+    cambio = fx[:-1] * fx[1:] < 0
+    izquierdos = [x[:-1][cambio]]
+    derechos = [x[1:][cambio]]
+
+    #Cerca de un extremo local f puede tocar el eje dos veces dentro de una misma celda:
+    if subdividir > 0 and puntos > 2:
+        d = np.diff(fx)
+        #Una diferencia nula tambien delata un extremo (f toma el mismo valor en
+        #los dos nodos de la celda), por ejemplo uno justo a mitad de celda:
+        extremos = np.flatnonzero(d[:-1] * d[1:] <= 0) + 1
+        #Los nodos consecutivos (mesetas) se agrupan en una sola ventana para no
+        #encontrar dos veces la misma raiz en ventanas solapadas:
+        cortes = np.flatnonzero(np.diff(extremos) > 1) + 1
+        primeros = np.array([g[0] for g in np.split(extremos, cortes) if g.size], dtype=int)
+        ultimos = np.array([g[-1] for g in np.split(extremos, cortes) if g.size], dtype=int)
+        inicios, finales = primeros - 1, ultimos + 1
+        #Se descartan las ventanas que ya contienen un cambio de signo o un cero de la malla:
+        acumulado_cambio = np.concatenate([[0], np.cumsum(cambio)])
+        acumulado_cero = np.concatenate([[0], np.cumsum(fx == 0)])
+        libres = ((acumulado_cambio[finales] == acumulado_cambio[inicios])
+                  & (acumulado_cero[finales] == acumulado_cero[inicios + 1]))
+        inicios, finales = inicios[libres], finales[libres]
+        if inicios.size:
+            t = np.linspace(0.0, 1.0, subdividir + 1)
+            xs = x[inicios, None] + (x[finales] - x[inicios])[:, None] * t
+            fs = _evaluar_vectorizado(f, xs)
+            raices.append(xs[:, 1:-1][fs[:, 1:-1] == 0])
+            cambio_fino = fs[:, :-1] * fs[:, 1:] < 0
+            izquierdos.append(xs[:, :-1][cambio_fino])
+            derechos.append(xs[:, 1:][cambio_fino])
+
+    izquierdos = np.concatenate(izquierdos)
+    derechos = np.concatenate(derechos)
+    if izquierdos.size:
+        refinadas, _, _ = biseccion_lote(f, izquierdos, derechos, er, n)
+        #Un cambio de signo tambien puede ser un polo (por ejemplo 1/x); lo descartamos
+        #si |f| en el punto refinado no queda por debajo de |f| en los extremos de la celda:
+        cota = np.minimum(np.abs(_evaluar_vectorizado(f, izquierdos)), np.abs(_evaluar_vectorizado(f, derechos)))
+        raices.append(refinadas[np.abs(_evaluar_vectorizado(f, refinadas)) <= cota])
+
+    return np.unique(np.concatenate(raices))
+
+def kseccion(f, a, b, er, n, k=4, ejecutor=None, mostrar_proceso=True):
+    """Algoritmo de k-seccion: generalizacion de la biseccion con k subintervalos.
+    En cada iteracion evalua f en los k-1 puntos interiores del intervalo al
+    mismo tiempo y conserva el subintervalo con cambio de signo, de modo que el
+    intervalo se reduce en un factor k por ronda.
+
+    Args:
+        f (callable): funcion objetivo; debe poder ejecutarse en paralelo.
+        a, b (float): extremos iniciales del intervalo donde se cree que hay una raiz.
+        er (float): error relativo maximo permitido (semiancho del intervalo / |raiz|).
+        n (int): numero maximo de iteraciones.
+        k (int): numero de subintervalos por iteracion (k=2 equivale a biseccion).
+        ejecutor (concurrent.futures.Executor, optional): grupo de trabajadores
+            donde se evaluan los puntos interiores. Si es None se crea un
+            ThreadPoolExecutor con k-1 hilos. Con un ProcessPoolExecutor, f debe
+            poder serializarse con pickle (no sirve una lambda).
+        mostrar_proceso (bool): si es True, muestra el proceso de calculo paso a paso.
+
+    Returns:
+        tuple: par `(raiz_aproximada, error_final)`.
+    """
+    if k < 2:
+        raise ValueError("k debe ser al menos 2.")
+
+    fa = f(a)
+    fb = f(b)
+
+    #Validacion que exista cambio de signo en el intervalo:
+    if fa * fb > 0:
+        raise ValueError("La funcion no cambia de signo en el intervalo dado.")
+
+    #Si un extremo ya es raiz no hay intervalo que reducir:
+    if fa == 0:
+        return a, 0.0
+    if fb == 0:
+        return b, 0.0
+
+    if mostrar_proceso:
+        print("\n" + "="*70)
+        print(f"MÉTODO DE K-SECCIÓN (k = {k})")
+        print("="*70)
+        print(f"Intervalo inicial: [a, b] = [{a}, {b}]")
+        print(f"Error máximo permitido (er): {er}")
+        print(f"Número máximo de iteraciones (n): {n}")
+        print("-"*70)
+        print(f"{'Iter':<6} {'a':<15} {'b':<15} {'m':<15} {'Error':<15}")
+        print("-"*70)
+
+    propio = ejecutor is None
+    if propio:
+        ejecutor = ThreadPoolExecutor(max_workers=k - 1)
+
+    ei = 1.0
+    i = 0
+    m_actual = (a + b) / 2
+    try:
+        while ei > er and i < n:
+            #Evaluamos los k-1 puntos interiores en paralelo:
+            h = (b - a) / k
+            interiores = [a + j * h for j in range(1, k)]
+            valores = list(ejecutor.map(f, interiores))
+
+            nodos = [a] + interiores + [b]
+            fnodos = [fa] + valores + [fb]
+            for j in range(1, k):
+                if fnodos[j] == 0:
+                    if mostrar_proceso:
+                        print(f"        ¡Raíz exacta encontrada! f({nodos[j]}) = 0")
+                        print("-"*70)
+                    return nodos[j], 0.0
+
+            #Conservamos el primer subintervalo con cambio de signo:
+            for j in range(k):
+                if fnodos[j] * fnodos[j + 1] < 0:
+                    a, b = nodos[j], nodos[j + 1]
+                    fa, fb = fnodos[j], fnodos[j + 1]
+                    break
+
+            #Con k impar el punto medio puede repetirse entre iteraciones,
+            #por eso el error se mide con el semiancho del intervalo:
+            m_actual = (a + b) / 2
+            ei = abs((b - a) / 2 / m_actual) if m_actual != 0 else abs(b - a) / 2
+
+            if mostrar_proceso:
+                print(f"{i:<6} {a:<15.7f} {b:<15.7f} {m_actual:<15.7f} {ei:<15.7f}")
+
+            i += 1
+    finally:
+        if propio:
+            ejecutor.shutdown()
+
+    # Mostramos resumen final:
+    if mostrar_proceso:
+        print("-"*70)
+        if ei <= er:
+            print(f"\n✓ Convergencia alcanzada en {i} iteraciones")
+        else:
+            print(f"\n⚠ Límite de iteraciones alcanzado ({n} iteraciones)")
+        print(f"Raíz aproximada: {m_actual:.7f}")
+        print(f"Error relativo final: {ei:.7f}")
+        print("="*70)
+
+    return m_actual, ei
+
 #Bloque de prueba:
 if __name__ == "__main__":
     # Encabezado del programa:
@@ -0,0 +1,85 @@
+"""
+Continuacion (arranque en caliente) para barridos de parametros.
+Resuelve f(x, p) = 0 para muchos valores de p reutilizando la raiz anterior
+como punto de partida de la siguiente, con un predictor secante. Solo recurre
+a un metodo cerrado (Brent) cuando el arranque en caliente falla.
+"""
+
+import math
+
+import biseccion
+import newton_raphson
+
+
+def barrido_parametrico(f, parametros, x0, er=1e-10, n=50, df=None, intervalo=None):
+    """Resuelve f(x, p) = 0 para cada valor de p con arranque en caliente.
+
+    Los parametros se recorren ordenados; para cada uno se predice la raiz
+    extrapolando las dos anteriores (predictor secante) y se corrige con
+    Newton-Raphson. Si Newton no converge y se dio `intervalo`, se usa Brent
+    en ese intervalo.
+
+    Args:
+        f (callable): funcion f(x, p).
+        parametros (iterable): valores del parametro p.
+        x0 (float): aproximacion inicial para el primer parametro (el menor).
+        er (float): cota maxima del error relativo permitido.
+        n (int): numero maximo de iteraciones por parametro.
+        df (callable o None): derivada parcial df/dx(x, p). Si es None se usa
+            diferenciacion automatica.
+        intervalo (tuple, optional): par `(a, b)` con cambio de signo para
+            todos los parametros; habilita el respaldo con Brent.
+
+    Returns:
+        tuple: `(raices, errores, evaluaciones)` como listas en el mismo orden
+            que `parametros`; `evaluaciones` cuenta las llamadas a f por parametro.
+    """
+    parametros = list(parametros)
+    orden = sorted(range(len(parametros)), key=lambda k: parametros[k])
+
+    raices = [None] * len(parametros)
+    errores = [None] * len(parametros)
+    evaluaciones = [0] * len(parametros)
+    # Historial (p, raiz) de las ultimas soluciones para el predictor:
+    historial = []
+
+    for k in orden:
+        p = parametros[k]
+        contador = [0]
+
+        def g(x, p=p, contador=contador):
+            contador[0] += 1
+            return f(x, p)
+
+        dg = (lambda x, p=p: df(x, p)) if df is not None else None
+
+        # Predictor: raiz anterior o extrapolacion secante de las dos ultimas:
+        if not historial:
+            x_pred = x0
+        elif len(historial) == 1 or historial[-1][0] == historial[-2][0]:
+            x_pred = historial[-1][1]
+        else:
+            (p1, x1), (p2, x2) = historial[-2], historial[-1]
+            x_pred = x2 + (x2 - x1) * (p - p2) / (p2 - p1)
+
+        # Corrector: Newton-Raphson desde la prediccion.
+        try:
+            raiz, ei, _ = newton_raphson.metodo_abierto(g, x_pred, er, n, "newton", df=dg, mostrar_proceso=False)
+            exito = ei <= er and math.isfinite(raiz)
+        except (ValueError, ZeroDivisionError, OverflowError):
+            exito = False
+
+        if exito:
+            historial = historial[-1:] + [(p, raiz)]
+        elif intervalo is not None:
+            raiz, ei = biseccion.brent(g, intervalo[0], intervalo[1], er, n, mostrar_proceso=False)
+            # La rama pudo cambiar: reiniciamos el predictor desde esta raiz.
+            historial = [(p, raiz)]
+        else:
+            raise ValueError(f"El arranque en caliente no convergió para p = {p} y no se dio un intervalo de respaldo.")
+
+        raices[k] = raiz
+        errores[k] = ei
+        evaluaciones[k] = contador[0]
+
+    return raices, errores, evaluaciones
@@ -0,0 +1,193 @@
+"""
+Cubatura multidimensional sobre cajas [a_1, b_1] x ... x [a_d, b_d].
+Incluye reglas producto tensorial construidas con la regla 1D de
+Gauss-Legendre de `integracion` y cuasi-Monte Carlo (Halton o Sobol) con
+desplazamientos aleatorios para estimar el error. El integrando recibe un
+arreglo de puntos de forma (k, d) y devuelve k valores; los puntos se generan
+por bloques para que la memoria quede acotada.
+"""
+
+import math
+
+import numpy as np
+
+import integracion
+
+# Primeros primos: bases de la secuencia de Halton (una por dimension).
+PRIMOS = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71)
+
+# Numeros de direccion de Joe y Kuo para Sobol (dimensiones 2 a 10):
+# (grado s del polinomio primitivo, coeficientes a, valores iniciales m_1..m_s).
+_SOBOL_DIRECCIONES = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+)
+
+# Bits de precision de los puntos de Sobol:
+_BITS_SOBOL = 32
+
+
+def _validar_limites(limites):
+    """Convierte los limites a arreglos (a, b) y valida la dimension."""
+    limites = np.asarray(limites, dtype=float)
+    if limites.ndim != 2 or limites.shape[1] != 2:
+        raise ValueError("Los limites deben ser una lista de pares (a_i, b_i).")
+    return limites[:, 0], limites[:, 1]
+
+
+def cubatura_producto(f, limites, orden=5, paneles=1, tam_bloque=integracion.TAM_BLOQUE):
+    """Regla producto tensorial de Gauss-Legendre compuesta.
+    En cada dimension se usan `paneles` paneles de `orden` puntos, de modo que
+    la regla tiene (paneles * orden)^d puntos; se recorren por bloques de
+    indices sin construir nunca la malla completa.
+
+    Args:
+        f (callable): integrando; recibe un arreglo (k, d) y devuelve k valores.
+        limites (list): pares (a_i, b_i) de la caja, uno por dimension.
+        orden (int): puntos de Gauss por panel y dimension.
+        paneles (int): paneles por dimension.
+        tam_bloque (int): numero maximo de puntos evaluados a la vez.
+
+    Returns:
+        float: aproximacion de la integral.
+    """
+    a, b = _validar_limites(limites)
+    d = a.size
+    nodos, pesos = integracion.nodos_gauss_legendre(orden)
+    nodos = np.array(nodos)
+    pesos = np.array(pesos)
+
+    # Nodos y pesos 1D compuestos de cada dimension:
+    ejes = []
+    pesos_ejes = []
+    for i in range(d):
+        h = (b[i] - a[i]) / paneles
+        centros = a[i] + (np.arange(paneles) + 0.5) * h
+        ejes.append((centros[:, None] + nodos[None, :] * h / 2).ravel())
+        pesos_ejes.append(np.tile(pesos * h / 2, paneles))
+
+    m = paneles * orden
+    total = m ** d
+    acumulador = integracion.SumaCompensada()
+    for i0 in range(0, total, tam_bloque):
+        i1 = min(i0 + tam_bloque, total)
+        indices = np.unravel_index(np.arange(i0, i1), (m,) * d)
+        puntos = np.stack([ejes[i][indices[i]] for i in range(d)], axis=1)
+        w = np.prod([pesos_ejes[i][indices[i]] for i in range(d)], axis=0)
+        acumulador.agregar(float(np.asarray(f(puntos)) @ w))
+    return acumulador.total
+
+
+def halton(inicio, fin, dimension):
+    """Puntos de Halton con indices [inicio, fin) en [0, 1)^dimension.
+
+    Returns:
+        numpy.ndarray: arreglo de forma (fin - inicio, dimension).
+    """
+    if dimension > len(PRIMOS):
+        raise ValueError(f"Halton admite hasta {len(PRIMOS)} dimensiones.")
+    # Se omite el indice 0 (el origen) como es habitual:
+    indices = np.arange(inicio, fin, dtype=np.int64) + 1
+    puntos = np.empty((indices.size, dimension))
+    for j in range(dimension):
+        base = PRIMOS[j]
+        n = indices.copy()
+        factor = 1.0 / base
+        inverso = np.zeros(indices.size)
+        # Inverso radical: se reflejan los digitos de n en base `base`.
+        while np.any(n > 0):
+            inverso += factor * (n % base)
+            n //= base
+            factor /= base
+        puntos[:, j] = inverso
+    return puntos
+
+
+def _direcciones_sobol(dimension):
+    """Tabla de numeros de direccion (enteros de _BITS_SOBOL bits) por dimension."""
+    if dimension > len(_SOBOL_DIRECCIONES) + 1:
+        raise ValueError(f"Sobol admite hasta {len(_SOBOL_DIRECCIONES) + 1} dimensiones.")
+    tabla = np.zeros((dimension, _BITS_SOBOL), dtype=np.uint64)
+    # Primera dimension: van der Corput en base 2.
+    tabla[0] = [1 << (_BITS_SOBOL - 1 - k) for k in range(_BITS_SOBOL)]
+    for j in range(1, dimension):
+        s, a, m = _SOBOL_DIRECCIONES[j - 1]
+        v = [0] * _BITS_SOBOL
+        for k in range(min(s, _BITS_SOBOL)):
+            v[k] = m[k] << (_BITS_SOBOL - 1 - k)
+        # Recurrencia del polinomio primitivo para el resto de los bits:
+        for k in range(s, _BITS_SOBOL):
+            v[k] = v[k - s] ^ (v[k - s] >> s)
+            for r in range(1, s):
+                if (a >> (s - 1 - r)) & 1:
+                    v[k] ^= v[k - r]
+        tabla[j] = v
+    return tabla
+
+
+def sobol(inicio, fin, dimension):
+    """Puntos de Sobol con indices [inicio, fin) en [0, 1)^dimension.
+
+    Returns:
+        numpy.ndarray: arreglo de forma (fin - inicio, dimension).
+    """
+    tabla = _direcciones_sobol(dimension)
+    indices = np.arange(inicio, fin, dtype=np.uint64)
+    enteros = np.zeros((indices.size, dimension), dtype=np.uint64)
+    for k in range(_BITS_SOBOL):
+        bit = ((indices >> np.uint64(k)) & np.uint64(1)).astype(bool)
+        enteros[bit] ^= tabla[:, k]
+    return enteros / float(1 << _BITS_SOBOL)
+
+
+SECUENCIAS = {"halton": halton, "sobol": sobol}
+
+
+def cubatura_cuasi_montecarlo(f, limites, muestras=2 ** 16, replicas=8, secuencia="sobol",
+                              semilla=None, tam_bloque=integracion.TAM_BLOQUE):
+    """Integracion cuasi-Monte Carlo con desplazamientos aleatorios.
+    Cada replica usa la misma secuencia de baja discrepancia desplazada (modulo 1)
+    por un vector aleatorio distinto; la media de las replicas es el valor y su
+    dispersion da una estimacion del error.
+
+    Args:
+        f (callable): integrando; recibe un arreglo (k, d) y devuelve k valores.
+        limites (list): pares (a_i, b_i) de la caja, uno por dimension.
+        muestras (int): puntos por replica (potencias de 2 para Sobol).
+        replicas (int): numero de desplazamientos aleatorios (al menos 2).
+        secuencia (str): "sobol" o "halton".
+        semilla (int, optional): semilla del generador de desplazamientos.
+        tam_bloque (int): numero maximo de puntos generados a la vez.
+
+    Returns:
+        tuple: par `(valor, error_estimado)`.
+    """
+    if secuencia not in SECUENCIAS:
+        raise ValueError("Secuencia no reconocida. Use: 'sobol' o 'halton'.")
+    if replicas < 2:
+        raise ValueError("Se necesitan al menos 2 replicas para estimar el error.")
+    a, b = _validar_limites(limites)
+    d = a.size
+    generar = SECUENCIAS[secuencia]
+    desplazamientos = np.random.default_rng(semilla).random((replicas, d))
+    volumen = float(np.prod(b - a))
+
+    acumuladores = [integracion.SumaCompensada() for _ in range(replicas)]
+    for i0 in range(0, muestras, tam_bloque):
+        i1 = min(i0 + tam_bloque, muestras)
+        base = generar(i0, i1, d)
+        for r in range(replicas):
+            u = (base + desplazamientos[r]) % 1.0
+            acumuladores[r].agregar(float(np.sum(f(a + u * (b - a)))))
+
+    estimaciones = np.array([acc.total for acc in acumuladores]) * volumen / muestras
+    valor = float(np.mean(estimaciones))
+    error = float(np.std(estimaciones, ddof=1) / math.sqrt(replicas))
+    return valor, error
@@ -0,0 +1,248 @@
+"""
+Diferenciacion automatica en modo directo mediante numeros duales.
+Un numero dual `valor + derivada*eps` (con eps^2 = 0) propaga la derivada a
+traves de las operaciones, de modo que una sola evaluacion de f entrega f(x)
+y f'(x). Las funciones elementales de este modulo sustituyen a las de `math`
+y tambien aceptan arreglos de numpy.
+"""
+
+import math
+
+# numpy es opcional: solo se usa cuando los valores son arreglos.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+pi = math.pi
+e = math.e
+
+
+def _modulo(v):
+    """Devuelve numpy si v es un arreglo de numpy; si no, el modulo math."""
+    if np is not None and isinstance(v, np.ndarray):
+        return np
+    return math
+
+
+class Dual:
+    """Numero dual con parte real `valor` y parte infinitesimal `derivada`."""
+
+    __slots__ = ("valor", "derivada")
+    # Hace que numpy delegue en los operadores reflejados de Dual (arreglo + Dual -> Dual).
+    __array_ufunc__ = None
+
+    def __init__(self, valor, derivada=0.0):
+        self.valor = valor
+        self.derivada = derivada
+
+    def __repr__(self):
+        return f"Dual({self.valor!r}, {self.derivada!r})"
+
+    def __float__(self):
+        raise TypeError(
+            "Un numero dual no se puede convertir a float; use las funciones de "
+            "diferenciacion_automatica (exp, log, sin, ...) en lugar de las de math."
+        )
+
+    def __add__(self, otro):
+        if isinstance(otro, Dual):
+            return Dual(self.valor + otro.valor, self.derivada + otro.derivada)
+        return Dual(self.valor + otro, self.derivada)
+
+    __radd__ = __add__
+
+    def __sub__(self, otro):
+        if isinstance(otro, Dual):
+            return Dual(self.valor - otro.valor, self.derivada - otro.derivada)
+        return Dual(self.valor - otro, self.derivada)
+
+    def __rsub__(self, otro):
+        return Dual(otro - self.valor, -self.derivada)
+
+    def __mul__(self, otro):
+        if isinstance(otro, Dual):
+            return Dual(self.valor * otro.valor, self.derivada * otro.valor + self.valor * otro.derivada)
+        return Dual(self.valor * otro, self.derivada * otro)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, otro):
+        if isinstance(otro, Dual):
+            return Dual(
+                self.valor / otro.valor,
+                (self.derivada * otro.valor - self.valor * otro.derivada) / (otro.valor * otro.valor),
+            )
+        return Dual(self.valor / otro, self.derivada / otro)
+
+    def __rtruediv__(self, otro):
+        return Dual(otro / self.valor, -otro * self.derivada / (self.valor * self.valor))
+
+    def __pow__(self, otro):
+        if isinstance(otro, Dual):
+            # x^y = exp(y * log(x))
+            return exp(otro * log(self))
+        if otro == 0:
+            return Dual(self.valor ** 0, self.derivada * 0)
+        return Dual(self.valor ** otro, otro * self.valor ** (otro - 1) * self.derivada)
+
+    def __rpow__(self, otro):
+        v = otro ** self.valor
+        return Dual(v, v * math.log(otro) * self.derivada)
+
+    def __neg__(self):
+        return Dual(-self.valor, -self.derivada)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        if np is not None and isinstance(self.valor, np.ndarray):
+            return Dual(np.abs(self.valor), np.sign(self.valor) * self.derivada)
+        return Dual(abs(self.valor), math.copysign(1.0, self.valor) * self.derivada)
+
+    # Las comparaciones solo miran la parte real (permiten `if x > 0` dentro de f):
+    def __lt__(self, otro):
+        return self.valor < (otro.valor if isinstance(otro, Dual) else otro)
+
+    def __le__(self, otro):
+        return self.valor <= (otro.valor if isinstance(otro, Dual) else otro)
+
+    def __gt__(self, otro):
+        return self.valor > (otro.valor if isinstance(otro, Dual) else otro)
+
+    def __ge__(self, otro):
+        return self.valor >= (otro.valor if isinstance(otro, Dual) else otro)
+
+    def __eq__(self, otro):
+        return self.valor == (otro.valor if isinstance(otro, Dual) else otro)
+
+    def __ne__(self, otro):
+        return self.valor != (otro.valor if isinstance(otro, Dual) else otro)
+
+    __hash__ = None
+
+
+def exp(x):
+    """Exponencial compatible con floats, arreglos y duales."""
+    if isinstance(x, Dual):
+        v = _modulo(x.valor).exp(x.valor)
+        return Dual(v, v * x.derivada)
+    return _modulo(x).exp(x)
+
+
+def log(x):
+    """Logaritmo natural compatible con floats, arreglos y duales."""
+    if isinstance(x, Dual):
+        return Dual(_modulo(x.valor).log(x.valor), x.derivada / x.valor)
+    return _modulo(x).log(x)
+
+
+def sqrt(x):
+    """Raiz cuadrada compatible con floats, arreglos y duales."""
+    if isinstance(x, Dual):
+        v = _modulo(x.valor).sqrt(x.valor)
+        return Dual(v, x.derivada / (2 * v))
+    return _modulo(x).sqrt(x)
+
+
+def sin(x):
+    """Seno compatible con floats, arreglos y duales."""
+    if isinstance(x, Dual):
+        m = _modulo(x.valor)
+        return Dual(m.sin(x.valor), m.cos(x.valor) * x.derivada)
+    return _modulo(x).sin(x)
+
+
+def cos(x):
+    """Coseno compatible con floats, arreglos y duales."""
+    if isinstance(x, Dual):
+        m = _modulo(x.valor)
+        return Dual(m.cos(x.valor), -m.sin(x.valor) * x.derivada)
+    return _modulo(x).cos(x)
+
+
+def tan(x):
+    """Tangente compatible con floats, arreglos y duales."""
+    if isinstance(x, Dual):
+        v = _modulo(x.valor).tan(x.valor)
+        return Dual(v, (1 + v * v) * x.derivada)
+    return _modulo(x).tan(x)
+
+
+def asin(x):
+    """Arcoseno compatible con floats, arreglos y duales."""
+    if isinstance(x, Dual):
+        m = _modulo(x.valor)
+        return Dual(m.arcsin(x.valor) if m is np else m.asin(x.valor), x.derivada / m.sqrt(1 - x.valor * x.valor))
+    m = _modulo(x)
+    return m.arcsin(x) if m is np else m.asin(x)
+
+
+def acos(x):
+    """Arcocoseno compatible con floats, arreglos y duales."""
+    if isinstance(x, Dual):
+        m = _modulo(x.valor)
+        return Dual(m.arccos(x.valor) if m is np else m.acos(x.valor), -x.derivada / m.sqrt(1 - x.valor * x.valor))
+    m = _modulo(x)
+    return m.arccos(x) if m is np else m.acos(x)
+
+
+def atan(x):
+    """Arcotangente compatible con floats, arreglos y duales."""
+    if isinstance(x, Dual):
+        m = _modulo(x.valor)
+        return Dual(m.arctan(x.valor) if m is np else m.atan(x.valor), x.derivada / (1 + x.valor * x.valor))
+    m = _modulo(x)
+    return m.arctan(x) if m is np else m.atan(x)
+
+
+def sinh(x):
+    """Seno hiperbolico compatible con floats, arreglos y duales."""
+    if isinstance(x, Dual):
+        m = _modulo(x.valor)
+        return Dual(m.sinh(x.valor), m.cosh(x.valor) * x.derivada)
+    return _modulo(x).sinh(x)
+
+
+def cosh(x):
+    """Coseno hiperbolico compatible con floats, arreglos y duales."""
+    if isinstance(x, Dual):
+        m = _modulo(x.valor)
+        return Dual(m.cosh(x.valor), m.sinh(x.valor) * x.derivada)
+    return _modulo(x).cosh(x)
+
+
+def tanh(x):
+    """Tangente hiperbolica compatible con floats, arreglos y duales."""
+    if isinstance(x, Dual):
+        v = _modulo(x.valor).tanh(x.valor)
+        return Dual(v, (1 - v * v) * x.derivada)
+    return _modulo(x).tanh(x)
+
+
+def valor_y_derivada(f, x):
+    """Evalua f y su derivada en x con una sola llamada a f.
+
+    Args:
+        f (callable): funcion escrita con operaciones aritmeticas y las
+            funciones de este modulo (no las de math).
+        x (float o numpy.ndarray): punto(s) de evaluacion.
+
+    Returns:
+        tuple: par `(f(x), f'(x))`.
+    """
+    if np is not None and isinstance(x, np.ndarray):
+        semilla = np.ones_like(x, dtype=float)
+    else:
+        semilla = 1.0
+    y = f(Dual(x, semilla))
+    if isinstance(y, Dual):
+        return y.valor, y.derivada
+    # f no depende de x (funcion constante):
+    return y, semilla * 0.0
+
+
+def derivada(f):
+    """Devuelve la funcion derivada f' calculada por diferenciacion automatica."""
+    return lambda x: valor_y_derivada(f, x)[1]
@@ -1,6 +1,56 @@
 #!/usr/bin/env python3
 
+import csv
+import heapq
+import importlib
+import json
 import math
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# numpy es opcional: si esta disponible, los integrandos que aceptan arreglos
+# se evaluan sobre toda la malla con una sola llamada.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Desplazamiento del nodo dentro de cada subintervalo segun la variante de Riemann:
+DESPLAZAMIENTOS = {"izquierdo": 0.0, "derecho": 1.0, "punto_medio": 0.5}
+
+# Regla de Gauss-Kronrod de 15 puntos (nodos positivos en [-1, 1] y pesos).
+# Los nodos de indice impar son los de Gauss de 7 puntos.
+_NODOS_KRONROD = (
+    0.991455371120812639206854697526329,
+    0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926,
+    0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013,
+    0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245,
+    0.000000000000000000000000000000000,
+)
+_PESOS_KRONROD = (
+    0.022935322010529224963732008058970,
+    0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518,
+    0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550,
+    0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649,
+    0.209482141084727828012999174891714,
+)
+_PESOS_GAUSS = (
+    0.129484966168869693270611432679082,
+    0.279705391489276667901467771423780,
+    0.381830050505118944950369775488975,
+    0.417959183673469387755102040816327,
+)
+
+# Numero de nodos que se generan y evaluan a la vez en el modo por bloques:
+TAM_BLOQUE = 1 << 20
+
+# Nodos y pesos de Gauss-Legendre ya calculados, por orden: {orden: (nodos, pesos)}
+_CACHE_GAUSS = {}
 
 
 def riemann_izquierdo(f, a, b, n):
@@ -66,28 +116,977 @@ def riemann_punto_medio(f, a, b, n):
     return suma
 
 
-def integrar(f, a, b, n=100, metodo="punto_medio"):
-    """Integración numérica por el método de Riemann.
-    Selecciona la variante (izquierdo, derecho o punto medio) y calcula la suma.
+def es_vectorizable(f, a, b):
+    """Indica si f acepta un arreglo de numpy y devuelve otro de la misma forma.
+    Se prueba con dos puntos interiores de [a, b] para no tocar singularidades
+    en los extremos.
+
+    Args:
+        f (callable): función a integrar.
+        a (float): límite inferior.
+        b (float): límite superior.
+
+    Returns:
+        bool: True si f puede evaluarse sobre un arreglo completo.
+    """
+    if np is None:
+        return False
+    prueba = a + np.array([0.25, 0.75]) * (b - a)
+    try:
+        with np.errstate(all="ignore"):
+            y = f(prueba)
+    except (TypeError, ValueError):
+        # Por ejemplo math.exp(arreglo) o un `if x > 0` dentro de f:
+        return False
+    return isinstance(y, np.ndarray) and y.shape == prueba.shape
+
+
+class SumaCompensada:
+    """Acumulador con suma compensada de Kahan-Babuška (Neumaier).
+    El error de redondeo acumulado no crece con el número de sumandos.
+    """
+
+    def __init__(self):
+        self.suma = 0.0
+        self.compensacion = 0.0
+
+    def agregar(self, valor):
+        """Suma `valor` guardando aparte la parte que se pierde por redondeo."""
+        t = self.suma + valor
+        if abs(self.suma) >= abs(valor):
+            self.compensacion += (self.suma - t) + valor
+        else:
+            self.compensacion += (valor - t) + self.suma
+        self.suma = t
+
+    @property
+    def total(self):
+        return self.suma + self.compensacion
+
+
+def suma_por_bloques(f, a, h, inicio, fin, desplazamiento, tam_bloque=TAM_BLOQUE, vectorizar=True):
+    """Suma f(a + (i + desplazamiento) * h) para i en [inicio, fin) por bloques.
+    Cada bloque se genera y evalúa por separado (memoria acotada por `tam_bloque`)
+    y su suma parcial se acumula con suma compensada.
 
     Args:
         f (callable): función a integrar.
+        a (float): origen de la malla.
+        h (float): paso entre nodos.
+        inicio, fin (int): rango de índices de nodos.
+        desplazamiento (float): posición del nodo dentro del subintervalo (0, 0.5 o 1).
+        tam_bloque (int): número de nodos por bloque.
+        vectorizar (bool): si es True cada bloque se evalúa con una sola llamada a f.
+
+    Returns:
+        float: suma de f sobre los nodos (sin multiplicar por h).
+    """
+    acumulador = SumaCompensada()
+    for i0 in range(inicio, fin, tam_bloque):
+        i1 = min(i0 + tam_bloque, fin)
+        if vectorizar:
+            x = a + (np.arange(i0, i1, dtype=float) + desplazamiento) * h
+            # np.sum usa suma por pares dentro del bloque:
+            acumulador.agregar(float(np.sum(f(x))))
+        else:
+            acumulador.agregar(math.fsum(f(a + (i + desplazamiento) * h) for i in range(i0, i1)))
+    return acumulador.total
+
+
+def riemann_vectorizado(f, a, b, n, metodo="punto_medio", tam_bloque=TAM_BLOQUE):
+    """Suma de Riemann evaluando f por bloques de la malla con una llamada por bloque.
+    Si n no supera `tam_bloque`, toda la malla se evalúa con una sola llamada.
+
+    Args:
+        f (callable): función a integrar, compatible con arreglos de numpy.
         a (float): límite inferior.
         b (float): límite superior.
         n (int): número de subintervalos.
         metodo (str): "izquierdo", "derecho" o "punto_medio".
+        tam_bloque (int): número máximo de nodos evaluados a la vez.
+
+    Returns:
+        float: aproximación de la integral.
+    """
+    h = (b - a) / n  # Paso entre subintervalos
+    return suma_por_bloques(f, a, h, 0, n, DESPLAZAMIENTOS[metodo], tam_bloque) * h
+
+
+def nodos_gauss_legendre(orden):
+    """Nodos y pesos de Gauss-Legendre de `orden` puntos en [-1, 1].
+    Se calculan una sola vez por orden (Newton sobre el polinomio de Legendre)
+    y se guardan en una caché del proceso.
+
+    Args:
+        orden (int): número de puntos de la regla.
+
+    Returns:
+        tuple: par `(nodos, pesos)` de tuplas ordenadas de menor a mayor nodo.
+    """
+    if orden in _CACHE_GAUSS:
+        return _CACHE_GAUSS[orden]
+    if orden < 1:
+        raise ValueError("El orden de Gauss-Legendre debe ser al menos 1.")
+
+    nodos = []
+    pesos = []
+    for i in range(1, orden + 1):
+        # Aproximación inicial de la i-ésima raíz de P_orden:
+        x = math.cos(math.pi * (i - 0.25) / (orden + 0.5))
+        for _ in range(100):
+            # Recurrencia de Bonnet para P_orden(x) y P_(orden-1)(x):
+            p0, p1 = 1.0, x
+            for k in range(2, orden + 1):
+                p0, p1 = p1, ((2 * k - 1) * x * p1 - (k - 1) * p0) / k
+            dp = orden * (x * p1 - p0) / (x * x - 1)
+            dx = p1 / dp
+            x -= dx
+            if abs(dx) < 1e-16:
+                break
+        nodos.append(x)
+        pesos.append(2 / ((1 - x * x) * dp * dp))
+
+    # Las raíces salen de mayor a menor:
+    resultado = (tuple(reversed(nodos)), tuple(reversed(pesos)))
+    _CACHE_GAUSS[orden] = resultado
+    return resultado
+
+
+def guardar_cache_gauss(ruta):
+    """Guarda en un archivo JSON los nodos y pesos de Gauss-Legendre calculados."""
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump({str(orden): [list(n), list(w)] for orden, (n, w) in _CACHE_GAUSS.items()}, archivo)
+
+
+def cargar_cache_gauss(ruta):
+    """Carga nodos y pesos de Gauss-Legendre desde un archivo JSON a la caché."""
+    with open(ruta, "r", encoding="utf-8") as archivo:
+        datos = json.load(archivo)
+    for orden, (n, w) in datos.items():
+        _CACHE_GAUSS[int(orden)] = (tuple(n), tuple(w))
+
+
+def gauss_legendre(f, a, b, n=1, orden=5, vectorizar=None):
+    """Cuadratura compuesta de Gauss-Legendre.
+    Divide [a, b] en n paneles iguales y aplica en cada uno la regla de
+    `orden` puntos (exacta para polinomios de grado 2*orden - 1).
+
+    Args:
+        f (callable): función a integrar.
+        a (float): límite inferior.
+        b (float): límite superior.
+        n (int): número de paneles.
+        orden (int): número de puntos de Gauss por panel.
+        vectorizar (bool, optional): si es None se detecta automáticamente.
+
+    Returns:
+        float: aproximación de la integral.
+    """
+    nodos, pesos = nodos_gauss_legendre(orden)
+    h = (b - a) / n  # Ancho de cada panel
+    if vectorizar is None:
+        vectorizar = es_vectorizable(f, a, b)
+
+    acumulador = SumaCompensada()
+    if vectorizar:
+        t = np.array(nodos) * (h / 2)
+        w = np.array(pesos)
+        paneles_por_bloque = max(1, TAM_BLOQUE // orden)
+        for i0 in range(0, n, paneles_por_bloque):
+            i1 = min(i0 + paneles_por_bloque, n)
+            centros = a + (np.arange(i0, i1, dtype=float) + 0.5) * h
+            acumulador.agregar(float(np.sum(f(centros[:, None] + t[None, :]) @ w)))
+    else:
+        for i in range(n):
+            centro = a + (i + 0.5) * h
+            acumulador.agregar(math.fsum(w * f(centro + x * h / 2) for x, w in zip(nodos, pesos)))
+    return acumulador.total * h / 2
+
+
+def integrar(f, a, b, n=100, metodo=None, vectorizar=None, tam_bloque=None, orden=5,
+             puntos_quiebre=None, detectar_saltos=False):
+    """Integración numérica por el método de Riemann o de Gauss-Legendre.
+    Selecciona la variante (izquierdo, derecho, punto medio o gauss) y calcula la suma.
+
+    Args:
+        f (callable): función a integrar.
+        a (float): límite inferior.
+        b (float): límite superior.
+        n (int): número de subintervalos (paneles para "gauss").
+        metodo (str, optional): "izquierdo", "derecho", "punto_medio" o "gauss".
+            Si es None se usa "punto_medio", o "gauss" cuando hay puntos de quiebre.
+        vectorizar (bool, optional): si es None se detecta automáticamente si f
+            acepta arreglos de numpy; True fuerza la evaluación vectorizada y
+            False el ciclo escalar.
+        tam_bloque (int, optional): si se indica, los nodos se generan y evalúan
+            por bloques de ese tamaño y se acumulan con suma compensada (memoria
+            constante para n muy grande). Con integrandos vectorizados se usa
+            siempre, con `TAM_BLOQUE` por defecto.
+        orden (int): puntos de Gauss por panel (solo para "gauss").
+        puntos_quiebre (list, optional): puntos de (a, b) donde f tiene saltos,
+            picos o singularidades. [a, b] se parte en esos puntos y los n
+            subintervalos se reparten entre los tramos según su longitud. Cada
+            tramo suave se integra por defecto con Gauss-Legendre (alto orden);
+            también se admite "punto_medio". Ninguna de las dos reglas evalúa f
+            en los extremos de un tramo, así que ningún nodo cae sobre un punto
+            de quiebre; por eso "izquierdo" y "derecho" se rechazan.
+        detectar_saltos (bool): si es True se buscan además los saltos de f
+            con `detectar_discontinuidades` y se usan como puntos de quiebre.
 
     Returns:
         float: aproximación de la integral.
     """
+    partir = puntos_quiebre is not None or detectar_saltos
+    if metodo is None:
+        metodo = "gauss" if partir else "punto_medio"
+    if metodo != "gauss" and metodo not in DESPLAZAMIENTOS:
+        raise ValueError("Método no reconocido. Use: 'izquierdo', 'derecho', 'punto_medio' o 'gauss'.")
+    if partir and metodo in ("izquierdo", "derecho"):
+        raise ValueError("Con puntos de quiebre use 'punto_medio' o 'gauss': los métodos izquierdo "
+                         "y derecho evalúan f justo sobre los puntos de quiebre.")
+    if vectorizar is None:
+        vectorizar = es_vectorizable(f, a, b)
+    if partir:
+        cortes = set(puntos_quiebre or ())
+        if detectar_saltos:
+            cortes.update(detectar_discontinuidades(f, a, b))
+        cortes = sorted((p for p in cortes if min(a, b) < p < max(a, b)), reverse=a > b)
+        if cortes:
+            bordes = [a] + cortes + [b]
+            # Reparto de los n subintervalos proporcional a la longitud de cada tramo:
+            return math.fsum(
+                integrar(f, izq, der, max(1, round(n * (der - izq) / (b - a))), metodo, vectorizar, tam_bloque, orden)
+                for izq, der in zip(bordes[:-1], bordes[1:])
+            )
+    if metodo == "gauss":
+        return gauss_legendre(f, a, b, n, orden, vectorizar)
+    if vectorizar:
+        return riemann_vectorizado(f, a, b, n, metodo, tam_bloque or TAM_BLOQUE)
+    if tam_bloque is not None:
+        h = (b - a) / n
+        return suma_por_bloques(f, a, h, 0, n, DESPLAZAMIENTOS[metodo], tam_bloque, vectorizar=False) * h
+
     if metodo == "izquierdo":
         return riemann_izquierdo(f, a, b, n)
     elif metodo == "derecho":
         return riemann_derecho(f, a, b, n)
-    elif metodo == "punto_medio":
-        return riemann_punto_medio(f, a, b, n)
+    return riemann_punto_medio(f, a, b, n)
+
+
+def detectar_discontinuidades(f, a, b, muestras=200, factor=10.0, er=1e-12):
+    """Busca saltos de f en [a, b] con un barrido grueso y los localiza por bisección.
+    Un subintervalo del barrido es sospechoso si la variación de f en él supera
+    `factor` veces la de sus vecinos (en una función suave las variaciones
+    consecutivas son parecidas). Los nodos donde f no es finita también se
+    devuelven, para usarlos como puntos de quiebre.
+
+    Args:
+        f (callable): función a analizar.
+        a (float): límite inferior.
+        b (float): límite superior.
+        muestras (int): número de subintervalos del barrido grueso.
+        factor (float): cuánto debe destacar una variación para considerarse salto.
+        er (float): cota del error relativo en la posición de cada salto.
+
+    Returns:
+        list: posiciones aproximadas de los saltos, ordenadas de menor a mayor.
+    """
+    if a > b:
+        a, b = b, a
+    h = (b - a) / muestras
+    x = [a + i * h for i in range(muestras + 1)]
+
+    def evaluar(t):
+        try:
+            return float(f(t))
+        except (ZeroDivisionError, ValueError, OverflowError):
+            return math.nan
+
+    y = [evaluar(t) for t in x]
+    saltos = [x[i] for i in range(1, muestras) if not math.isfinite(y[i])]
+
+    finitos = [abs(v) for v in y if math.isfinite(v)]
+    # Variaciones por debajo de esta escala son ruido de redondeo:
+    piso = 1e-12 * max(finitos, default=0.0)
+    variaciones = [abs(y[i + 1] - y[i]) for i in range(muestras)]
+    for i, d in enumerate(variaciones):
+        if not math.isfinite(d):
+            continue
+        vecinas = [variaciones[j] for j in (i - 1, i + 1) if 0 <= j < muestras and math.isfinite(variaciones[j])]
+        if d <= piso or d <= factor * max(vecinas, default=0.0):
+            continue
+
+        # Bisección: conservamos la mitad donde f varía más.
+        izq, der = x[i], x[i + 1]
+        f_izq, f_der = y[i], y[i + 1]
+        while der - izq > er * max(1.0, abs(izq), abs(der)):
+            medio = (izq + der) / 2
+            f_medio = evaluar(medio)
+            if not math.isfinite(f_medio):
+                izq = der = medio
+                break
+            if abs(f_medio - f_izq) >= abs(f_der - f_medio):
+                der, f_der = medio, f_medio
+            else:
+                izq, f_izq = medio, f_medio
+        saltos.append((izq + der) / 2)
+    return sorted(saltos)
+
+
+def _gauss_kronrod_15(f, a, b, vectorizar):
+    """Aplica la regla de Gauss-Kronrod (7, 15) en [a, b].
+
+    Returns:
+        tuple: par `(integral, error_estimado)` con la estimación de error de QUADPACK.
+    """
+    centro = (a + b) / 2
+    radio = (b - a) / 2
+    desplazamientos = [radio * x for x in _NODOS_KRONROD[:7]]
+    nodos = [centro - d for d in desplazamientos] + [centro] + [centro + d for d in reversed(desplazamientos)]
+    if vectorizar:
+        valores = [float(v) for v in f(np.array(nodos))]
     else:
+        valores = [f(x) for x in nodos]
+
+    # Pesos alineados con los 15 nodos (simetricos respecto al centro):
+    pesos_k = _PESOS_KRONROD[:7] + (_PESOS_KRONROD[7],) + tuple(reversed(_PESOS_KRONROD[:7]))
+    resultado_k = math.fsum(w * v for w, v in zip(pesos_k, valores))
+    resultado_g = math.fsum(
+        w * (valores[j] + valores[14 - j]) for w, j in zip(_PESOS_GAUSS[:3], (1, 3, 5))
+    ) + _PESOS_GAUSS[3] * valores[7]
+
+    media = resultado_k / 2
+    res_abs = math.fsum(w * abs(v) for w, v in zip(pesos_k, valores)) * abs(radio)
+    res_asc = math.fsum(w * abs(v - media) for w, v in zip(pesos_k, valores)) * abs(radio)
+    error = abs((resultado_k - resultado_g) * radio)
+    if res_asc != 0 and error != 0:
+        error = res_asc * min(1.0, (200 * error / res_asc) ** 1.5)
+    # Nunca prometemos menos que el error de redondeo de la propia suma:
+    error = max(50 * 2.0 ** -52 * res_abs, error)
+    return resultado_k * radio, error
+
+
+def integrar_adaptativo(f, a, b, tol=1e-8, max_subdivisiones=200):
+    """Integración adaptativa de Gauss-Kronrod guiada por una tolerancia.
+    Parte de un solo panel y subdivide siempre el panel con mayor error estimado
+    hasta que la suma de errores cae por debajo de `tol`, de modo que solo se
+    refinan las zonas difíciles del integrando.
+
+    Args:
+        f (callable): función a integrar.
+        a (float): límite inferior.
+        b (float): límite superior.
+        tol (float): error absoluto máximo deseado.
+        max_subdivisiones (int): número máximo de paneles.
+
+    Returns:
+        tuple: `(valor, error_estimado, evaluaciones)`.
+    """
+    vectorizar = es_vectorizable(f, a, b)
+    valor, error = _gauss_kronrod_15(f, a, b, vectorizar)
+    evaluaciones = 15
+    # Montículo de paneles ordenado por error (negado para sacar primero el mayor):
+    paneles = [(-error, a, b, valor)]
+
+    while error > tol and len(paneles) < max_subdivisiones:
+        _, izq, der, _ = heapq.heappop(paneles)
+        medio = (izq + der) / 2
+        for p0, p1 in ((izq, medio), (medio, der)):
+            v, e = _gauss_kronrod_15(f, p0, p1, vectorizar)
+            heapq.heappush(paneles, (-e, p0, p1, v))
+        evaluaciones += 30
+        valor = math.fsum(p[3] for p in paneles)
+        error = math.fsum(-p[0] for p in paneles)
+
+    return valor, error, evaluaciones
+
+
+class Romberg:
+    """Integración de Romberg incremental sobre trapecios anidados.
+    Cada refinamiento duplica los subintervalos evaluando solo los nuevos
+    puntos medios; los valores ya calculados quedan en la tabla de
+    extrapolación de Richardson, así que mejorar la precisión cuesta solo los
+    puntos nuevos.
+
+    Atributos:
+        tabla (list): tabla triangular de Romberg; `tabla[k][0]` es el trapecio
+            con 2^k subintervalos y `tabla[k][j]` su j-ésima extrapolación.
+        evaluaciones (int): número total de evaluaciones de f.
+    """
+
+    def __init__(self, f, a, b):
+        self.f = f
+        self.a = a
+        self.b = b
+        self._vectorizar = es_vectorizable(f, a, b)
+        self._n = 1  # Subintervalos del último trapecio
+        self.tabla = [[(b - a) * (float(f(a)) + float(f(b))) / 2]]
+        self.evaluaciones = 2
+
+    @property
+    def valor(self):
+        """Mejor aproximación disponible (último elemento de la diagonal)."""
+        return self.tabla[-1][-1]
+
+    @property
+    def error(self):
+        """Estimación del error: diferencia entre las dos últimas diagonales."""
+        if len(self.tabla) < 2:
+            return math.inf
+        return abs(self.tabla[-1][-1] - self.tabla[-2][-1])
+
+    def refinar(self):
+        """Agrega un nivel: evalúa los n nuevos puntos medios y extrapola."""
+        h = (self.b - self.a) / self._n
+        suma_medios = suma_por_bloques(self.f, self.a, h, 0, self._n, 0.5, vectorizar=self._vectorizar)
+        self.evaluaciones += self._n
+        self._n *= 2
+
+        # T(h/2) = T(h)/2 + (h/2) * suma de f en los puntos medios:
+        anterior = self.tabla[-1]
+        fila = [anterior[0] / 2 + h / 2 * suma_medios]
+        for j in range(1, len(anterior) + 1):
+            factor = 4 ** j
+            fila.append(fila[j - 1] + (fila[j - 1] - anterior[j - 1]) / (factor - 1))
+        self.tabla.append(fila)
+        return self.valor
+
+    def integrar_hasta(self, tol, max_niveles=20):
+        """Refina hasta que el error estimado sea menor que `tol`.
+
+        Args:
+            tol (float): error absoluto máximo deseado.
+            max_niveles (int): número máximo de niveles de la tabla.
+
+        Returns:
+            tuple: par `(valor, error_estimado)`.
+        """
+        while (len(self.tabla) < 3 or self.error > tol) and len(self.tabla) < max_niveles:
+            self.refinar()
+        return self.valor, self.error
+
+
+def integrar_romberg(f, a, b, tol=1e-10, max_niveles=20):
+    """Integración de Romberg hasta alcanzar una tolerancia.
+
+    Args:
+        f (callable): función a integrar.
+        a (float): límite inferior.
+        b (float): límite superior.
+        tol (float): error absoluto máximo deseado.
+        max_niveles (int): número máximo de niveles de la tabla.
+
+    Returns:
+        tuple: `(valor, error_estimado, evaluaciones)`.
+    """
+    romberg = Romberg(f, a, b)
+    valor, error = romberg.integrar_hasta(tol, max_niveles)
+    return valor, error, romberg.evaluaciones
+
+
+def resolver_integrando(especificacion):
+    """Convierte una especificación serializable del integrando en una función.
+
+    Args:
+        especificacion (callable o str): la propia función, o un texto
+            "modulo:funcion" (por ejemplo "numpy:sin" o "math:exp") que cada
+            proceso trabajador puede importar por su cuenta.
+
+    Returns:
+        callable: función integrando.
+    """
+    if callable(especificacion):
+        return especificacion
+    modulo, _, nombre = especificacion.partition(":")
+    if not nombre:
+        raise ValueError("La especificación del integrando debe tener la forma 'modulo:funcion'.")
+    objeto = importlib.import_module(modulo)
+    for parte in nombre.split("."):
+        objeto = getattr(objeto, parte)
+    return objeto
+
+
+def _suma_panel(tarea):
+    """Suma de f sobre el rango de nodos de un panel (se ejecuta en un trabajador)."""
+    especificacion, a, h, inicio, fin, desplazamiento, tam_bloque, vectorizar = tarea
+    f = resolver_integrando(especificacion)
+    return suma_por_bloques(f, a, h, inicio, fin, desplazamiento, tam_bloque, vectorizar)
+
+
+def integrar_paralelo(f, a, b, n=100, metodo="punto_medio", paneles=64, max_workers=None,
+                      ejecutor="procesos", tam_bloque=TAM_BLOQUE):
+    """Integración de Riemann en varios núcleos por descomposición del dominio.
+    La malla global de n subintervalos se reparte en `paneles` rangos fijos de
+    nodos; cada panel se suma en un trabajador y las sumas parciales se reducen
+    con `math.fsum` (redondeo correcto). Como el reparto no depende del número
+    de trabajadores, el resultado es idéntico bit a bit con cualquier `max_workers`.
+
+    Args:
+        f (callable o str): función a integrar. Con procesos debe poder
+            serializarse (función de nivel de módulo) o darse como "modulo:funcion".
+        a (float): límite inferior.
+        b (float): límite superior.
+        n (int): número total de subintervalos.
+        metodo (str): "izquierdo", "derecho" o "punto_medio".
+        paneles (int): número de paneles en que se divide la malla.
+        max_workers (int, optional): número de trabajadores del grupo.
+        ejecutor (str): "procesos" (ProcessPoolExecutor) o "hilos"
+            (ThreadPoolExecutor, útil con integrandos de numpy que liberan el GIL).
+        tam_bloque (int): número máximo de nodos evaluados a la vez por trabajador.
+
+    Returns:
+        float: aproximación de la integral.
+    """
+    if metodo not in DESPLAZAMIENTOS:
         raise ValueError("Método no reconocido. Use: 'izquierdo', 'derecho' o 'punto_medio'.")
+    if ejecutor == "procesos":
+        grupo = ProcessPoolExecutor
+    elif ejecutor == "hilos":
+        grupo = ThreadPoolExecutor
+    else:
+        raise ValueError("Ejecutor no reconocido. Use: 'procesos' o 'hilos'.")
+
+    h = (b - a) / n  # Paso entre subintervalos
+    vectorizar = es_vectorizable(resolver_integrando(f), a, b)
+    paneles = max(1, min(paneles, n))
+    limites = [n * k // paneles for k in range(paneles + 1)]
+    tareas = [
+        (f, a, h, limites[k], limites[k + 1], DESPLAZAMIENTOS[metodo], tam_bloque, vectorizar)
+        for k in range(paneles)
+    ]
+
+    with grupo(max_workers=max_workers) as trabajadores:
+        parciales = list(trabajadores.map(_suma_panel, tareas))
+    return math.fsum(parciales) * h
+
+
+def trapecio_muestras(y, x=None, dx=1.0, tam_bloque=TAM_BLOQUE):
+    """Regla del trapecio sobre datos muestreados.
+    Recorre las muestras por bloques (con un punto de solapamiento), de modo
+    que arreglos mapeados en memoria de varios gigabytes no se copian enteros.
+
+    Args:
+        y (array_like): valores muestreados (puede ser un numpy.memmap).
+        x (array_like, optional): abscisas de las muestras, espaciado libre.
+            Si es None se supone espaciado uniforme `dx`.
+        dx (float): separación entre muestras cuando x es None.
+        tam_bloque (int): número de intervalos procesados a la vez.
+
+    Returns:
+        float: aproximación de la integral.
+    """
+    if np is None:
+        raise ImportError("trapecio_muestras requiere numpy.")
+    total = len(y)
+    if x is not None and len(x) != total:
+        raise ValueError("x e y deben tener la misma longitud.")
+
+    acumulador = SumaCompensada()
+    for i0 in range(0, total - 1, tam_bloque):
+        i1 = min(i0 + tam_bloque, total - 1)
+        ys = np.asarray(y[i0:i1 + 1], dtype=float)
+        medias = (ys[:-1] + ys[1:]) / 2
+        if x is None:
+            acumulador.agregar(float(np.sum(medias)) * dx)
+        else:
+            xs = np.asarray(x[i0:i1 + 1], dtype=float)
+            acumulador.agregar(float(np.sum(np.diff(xs) * medias)))
+    return acumulador.total
+
+
+def simpson_muestras(y, x=None, dx=1.0, tam_bloque=TAM_BLOQUE):
+    """Regla de Simpson compuesta sobre datos muestreados (espaciado uniforme o no).
+    Integra pares de intervalos con la parábola que pasa por sus tres puntos;
+    si el número de intervalos es impar, el último intervalo se integra con la
+    parábola de las tres últimas muestras.
+
+    Args:
+        y (array_like): valores muestreados (puede ser un numpy.memmap).
+        x (array_like, optional): abscisas de las muestras. Si es None se supone
+            espaciado uniforme `dx`.
+        dx (float): separación entre muestras cuando x es None.
+        tam_bloque (int): número de intervalos procesados a la vez (se redondea a par).
+
+    Returns:
+        float: aproximación de la integral.
+    """
+    if np is None:
+        raise ImportError("simpson_muestras requiere numpy.")
+    total = len(y)
+    if x is not None and len(x) != total:
+        raise ValueError("x e y deben tener la misma longitud.")
+    if total < 3:
+        return trapecio_muestras(y, x, dx)
+
+    def abscisas(i0, i1):
+        if x is None:
+            return np.arange(i0, i1, dtype=float) * dx
+        return np.asarray(x[i0:i1], dtype=float)
+
+    intervalos = total - 1
+    pares = intervalos - intervalos % 2
+    tam_bloque = max(2, tam_bloque - tam_bloque % 2)
+    acumulador = SumaCompensada()
+    for i0 in range(0, pares, tam_bloque):
+        i1 = min(i0 + tam_bloque, pares)
+        ys = np.asarray(y[i0:i1 + 1], dtype=float)
+        h = np.diff(abscisas(i0, i1 + 1))
+        h0, h1 = h[0::2], h[1::2]
+        y0, y1, y2 = ys[0:-1:2], ys[1::2], ys[2::2]
+        suma = (h0 + h1) / 6 * ((2 - h1 / h0) * y0 + (h0 + h1) ** 2 / (h0 * h1) * y1 + (2 - h0 / h1) * y2)
+        acumulador.agregar(float(np.sum(suma)))
+
+    if intervalos % 2:
+        # Último intervalo con la parábola de las tres últimas muestras:
+        y0, y1, y2 = (float(v) for v in y[total - 3:total])
+        h0, h1 = np.diff(abscisas(total - 3, total))
+        alfa = (2 * h1 ** 2 + 3 * h0 * h1) / (6 * (h0 + h1))
+        beta = (h1 ** 2 + 3 * h0 * h1) / (6 * h0)
+        eta = h1 ** 3 / (6 * h0 * (h0 + h1))
+        acumulador.agregar(float(alfa * y2 + beta * y1 - eta * y0))
+    return acumulador.total
+
+
+def cargar_muestras(ruta, dtype="float64", forma=None):
+    """Abre un archivo de muestras sin copiarlo a memoria (mapeo en memoria).
+
+    Args:
+        ruta (str): archivo `.npy` o binario crudo.
+        dtype (str): tipo de dato del binario crudo (se ignora para `.npy`).
+        forma (tuple, optional): forma del binario crudo; por defecto 1D.
+
+    Returns:
+        numpy.memmap: arreglo de solo lectura respaldado por el archivo.
+    """
+    if np is None:
+        raise ImportError("cargar_muestras requiere numpy.")
+    if str(ruta).endswith(".npy"):
+        return np.load(ruta, mmap_mode="r")
+    return np.memmap(ruta, dtype=dtype, mode="r", shape=forma)
+
+
+def integrar_csv(ruta, columna_x=0, columna_y=1, delimitador=",", encabezado=True, tam_bloque=100000):
+    """Integra por trapecios una señal guardada en CSV leyéndola por bloques.
+    Las abscisas pueden tener espaciado irregular; el archivo nunca se carga
+    completo (se conserva la última muestra de cada bloque para el siguiente).
+
+    Args:
+        ruta (str): archivo CSV.
+        columna_x (int): índice de la columna de abscisas.
+        columna_y (int): índice de la columna de valores.
+        delimitador (str): separador de columnas.
+        encabezado (bool): si es True se salta la primera fila.
+        tam_bloque (int): número de filas leídas por bloque.
+
+    Returns:
+        float: aproximación de la integral.
+    """
+    if np is None:
+        raise ImportError("integrar_csv requiere numpy.")
+    acumulador = SumaCompensada()
+    anterior = None  # Última muestra (x, y) del bloque previo
+    with open(ruta, "r", encoding="utf-8", newline="") as archivo:
+        lector = csv.reader(archivo, delimiter=delimitador)
+        if encabezado:
+            next(lector, None)
+        xs, ys = [], []
+        for fila in lector:
+            if not fila:
+                continue
+            xs.append(float(fila[columna_x]))
+            ys.append(float(fila[columna_y]))
+            if len(xs) >= tam_bloque:
+                anterior = _agregar_bloque_csv(acumulador, anterior, xs, ys)
+                xs, ys = [], []
+        if xs:
+            _agregar_bloque_csv(acumulador, anterior, xs, ys)
+    return acumulador.total
+
+
+def _agregar_bloque_csv(acumulador, anterior, xs, ys):
+    """Suma los trapecios de un bloque del CSV (incluido el que lo une al previo)."""
+    if anterior is not None:
+        xs.insert(0, anterior[0])
+        ys.insert(0, anterior[1])
+    acumulador.agregar(trapecio_muestras(np.array(ys), np.array(xs)))
+    return xs[-1], ys[-1]
+
+
+def integrar_lote(f, a, b, parametros, n=100, metodo="punto_medio", orden=5, tam_bloque=TAM_BLOQUE):
+    """Integra una familia paramétrica f(x, p) para muchos valores de p a la vez.
+    Los nodos y pesos de referencia en [0, 1] se generan una sola vez y se
+    reutilizan en todo el lote; cada bloque de parámetros se evalúa con una
+    sola llamada a f sobre una malla 2D (parámetro x nodo).
+
+    Args:
+        f (callable): integrando f(x, p) compatible con arreglos de numpy.
+        a, b (float o array_like): límites comunes o uno por parámetro.
+        parametros (array_like): valores 1D del parámetro p.
+        n (int): subintervalos (paneles para "gauss").
+        metodo (str): "izquierdo", "derecho", "punto_medio" o "gauss".
+        orden (int): puntos de Gauss por panel (solo para "gauss").
+        tam_bloque (int): número máximo de evaluaciones de f por llamada.
+
+    Returns:
+        numpy.ndarray: integral para cada parámetro.
+    """
+    if np is None:
+        raise ImportError("integrar_lote requiere numpy.")
+
+    # Nodos t y pesos w de referencia en [0, 1]: ∫_a^b f ≈ (b - a) Σ w_j f(a + (b - a) t_j).
+    if metodo == "gauss":
+        nodos, pesos = nodos_gauss_legendre(orden)
+        t = ((np.arange(n)[:, None] + 0.5) + np.array(nodos)[None, :] / 2).ravel() / n
+        w = np.tile(np.array(pesos) / (2 * n), n)
+    elif metodo in DESPLAZAMIENTOS:
+        t = (np.arange(n) + DESPLAZAMIENTOS[metodo]) / n
+        w = np.full(n, 1.0 / n)
+    else:
+        raise ValueError("Método no reconocido. Use: 'izquierdo', 'derecho', 'punto_medio' o 'gauss'.")
+
+    p = np.asarray(parametros, dtype=float).ravel()
+    a = np.broadcast_to(np.asarray(a, dtype=float), p.shape)
+    b = np.broadcast_to(np.asarray(b, dtype=float), p.shape)
+    resultados = np.empty(p.shape)
+
+    filas = max(1, tam_bloque // t.size)
+    for i0 in range(0, p.size, filas):
+        i1 = min(i0 + filas, p.size)
+        ancho = b[i0:i1] - a[i0:i1]
+        x = a[i0:i1, None] + ancho[:, None] * t[None, :]
+        valores = np.broadcast_to(f(x, p[i0:i1, None]), x.shape)
+        resultados[i0:i1] = (valores @ w) * ancho
+    return resultados
+
+
+class Antiderivada:
+    """Primitiva F(x) = ∫_a^x f tabulada en una malla uniforme.
+    Guarda F y f en los nodos y evalúa entre nodos con el interpolante cúbico
+    de Hermite (F' = f), así que cada consulta cuesta O(1) y no vuelve a
+    evaluar f.
+
+    Attributes:
+        x (numpy.ndarray): nodos de la malla (a = x_0, ..., x_n = b).
+        valores (numpy.ndarray): F en los nodos.
+        derivadas (numpy.ndarray): f en los nodos.
+    """
+
+    def __init__(self, x, valores, derivadas):
+        self.x = x
+        self.valores = valores
+        self.derivadas = derivadas
+
+    def __call__(self, t):
+        """Evalúa F en t (escalar o arreglo) dentro de [a, b]."""
+        x, n = self.x, self.x.size - 1
+        h = (x[-1] - x[0]) / n
+        t_arr = np.asarray(t, dtype=float)
+        s = (t_arr - x[0]) / h
+        if np.any((s < -1e-12) | (s > n + 1e-12)):
+            raise ValueError("El punto de evaluación está fuera del intervalo de integración.")
+        i = np.clip(np.floor(s).astype(int), 0, n - 1)
+        s = s - i
+        # Base cúbica de Hermite en el subintervalo i:
+        h00 = (1 + 2 * s) * (1 - s) ** 2
+        h10 = s * (1 - s) ** 2
+        h01 = s * s * (3 - 2 * s)
+        h11 = s * s * (s - 1)
+        F = (h00 * self.valores[i] + h01 * self.valores[i + 1]
+             + h * (h10 * self.derivadas[i] + h11 * self.derivadas[i + 1]))
+        return float(F) if np.ndim(t) == 0 else F
+
+
+def integral_acumulada(f, a, b, n=100, metodo="simpson", puntos=None):
+    """Integral acumulada F(x) = ∫_a^x f para todos los nodos en una sola pasada.
+    Se evalúa f una vez en los n + 1 nodos de la malla y los incrementos de
+    cada subintervalo se acumulan con una suma prefijo, en lugar de integrar
+    desde a para cada límite superior.
+
+    Con "simpson" cada subintervalo [x_i, x_(i+1)] se integra con la cúbica
+    que pasa por los cuatro nodos vecinos (la parábola de los tres primeros o
+    últimos en los extremos), con error O(h^4) en todos los nodos; con
+    "trapecio" el error es O(h^2).
+
+    Args:
+        f (callable): función a integrar.
+        a (float): límite inferior.
+        b (float): límite superior de la tabla.
+        n (int): número de subintervalos.
+        metodo (str): "trapecio" o "simpson".
+        puntos (array_like, optional): límites superiores donde se quiere la
+            integral; si se dan se devuelve F en esos puntos.
+
+    Returns:
+        Antiderivada o numpy.ndarray: la primitiva tabulada (consultable en
+            cualquier x de [a, b]) o sus valores en `puntos`.
+    """
+    if np is None:
+        raise ImportError("integral_acumulada requiere numpy.")
+    if metodo not in ("trapecio", "simpson"):
+        raise ValueError("Método no reconocido. Use: 'trapecio' o 'simpson'.")
+    x = np.linspace(a, b, n + 1)
+    h = (b - a) / n
+    if es_vectorizable(f, a, b):
+        y = np.broadcast_to(np.asarray(f(x), dtype=float), x.shape).copy()
+    else:
+        y = np.fromiter((f(xi) for xi in x), dtype=float, count=x.size)
+
+    if metodo == "simpson" and n >= 3:
+        incrementos = np.empty(n)
+        # Cúbica de x_(i-1), ..., x_(i+2) en el interior y parábola en los extremos:
+        incrementos[1:-1] = h / 24 * (13 * (y[1:-2] + y[2:-1]) - y[:-3] - y[3:])
+        incrementos[0] = h / 12 * (5 * y[0] + 8 * y[1] - y[2])
+        incrementos[-1] = h / 12 * (-y[-3] + 8 * y[-2] + 5 * y[-1])
+    elif metodo == "simpson" and n == 2:
+        incrementos = h / 12 * np.array([5 * y[0] + 8 * y[1] - y[2], -y[0] + 8 * y[1] + 5 * y[2]])
+    else:
+        incrementos = h / 2 * (y[:-1] + y[1:])
+
+    valores = np.empty(n + 1)
+    valores[0] = 0.0
+    np.cumsum(incrementos, out=valores[1:])
+    primitiva = Antiderivada(x, valores, y)
+    if puntos is not None:
+        return primitiva(puntos)
+    return primitiva
+
+
+def _transformacion_doble_exponencial(a, b):
+    """Elige la transformación doble exponencial adecuada a los límites:
+    tanh-sinh para [a, b] finito, exp-sinh para un límite infinito y sinh-sinh
+    para (-inf, inf).
+
+    Returns:
+        tuple: `(transformar, t_bajo, t_alto)` donde `transformar(t)` devuelve
+            `(x, peso, distancia)`, con `distancia` la separación entre x y el
+            extremo finito más cercano calculada sin cancelación (inf si no hay
+            extremos finitos), y [t_bajo, t_alto] es el rango útil de t. Del lado
+            de un límite infinito t se acota en 4 (|x| ~ 1e18) para no desbordar f.
+    """
+    mitad_pi = math.pi / 2
+    if math.isinf(a) and math.isinf(b):
+        def transformar(t):
+            u = mitad_pi * math.sinh(t)
+            return math.sinh(u), mitad_pi * math.cosh(t) * math.cosh(u), math.inf
+        return transformar, -4.0, 4.0
+    if math.isinf(b):
+        def transformar(t):
+            e = math.exp(mitad_pi * math.sinh(t))
+            return a + e, mitad_pi * math.cosh(t) * e, e
+        return transformar, -6.0, 4.0
+    if math.isinf(a):
+        def transformar(t):
+            e = math.exp(-mitad_pi * math.sinh(t))
+            return b - e, mitad_pi * math.cosh(t) * e, e
+        return transformar, -4.0, 6.0
+
+    mitad = (b - a) / 2
+
+    def transformar(t):
+        u = abs(mitad_pi * math.sinh(t))
+        # Distancia al extremo más cercano (1 - tanh u) y peso, sin cancelación ni desbordes:
+        e = math.exp(-2 * u)
+        delta = 2 * e / (1 + e)
+        x = b - mitad * delta if t >= 0 else a + mitad * delta
+        return x, mitad * mitad_pi * math.cosh(t) * 4 * e / (1 + e) ** 2, mitad * delta
+    return transformar, -6.0, 6.0
+
+
+def integrar_tanh_sinh(f, a, b, tol=1e-12, max_niveles=8, con_distancia=False):
+    """Integración doble exponencial (tanh-sinh) para singularidades en los extremos
+    e integrales impropias.
+    Con el cambio de variable x = φ(t) el integrando decae doble-exponencialmente
+    en t, y la regla del trapecio en t converge muy rápido aunque f sea singular
+    en a o b. Los límites pueden ser `math.inf` o `-math.inf`. Cada nivel divide
+    el paso a la mitad y reutiliza todos los puntos anteriores.
+
+    Junto a un extremo finito distinto de cero, x = b - d se redondea y f pierde
+    precisión (por ejemplo 1 - x² cerca de x = 1); los nodos que caen sobre el
+    extremo se descartan. Con `con_distancia=True` f recibe además d = |x - extremo|
+    calculada sin cancelación, y puede escribirse en términos de d
+    (1/sqrt(1 - x²) = 1/sqrt(d (2 - d))) para conservar toda la precisión.
+
+    Args:
+        f (callable): función a integrar (no se evalúa en los extremos); f(x) o,
+            con `con_distancia`, f(x, d).
+        a (float): límite inferior (puede ser -math.inf).
+        b (float): límite superior (puede ser math.inf).
+        tol (float): error relativo deseado (absoluto si la integral es menor que 1).
+        max_niveles (int): número máximo de divisiones del paso.
+        con_distancia (bool): si es True se llama a f(x, d) con d la distancia de
+            x al extremo finito más cercano (math.inf si ambos son infinitos).
+
+    Returns:
+        tuple: `(valor, error_estimado, evaluaciones)`. El error incluye una cota
+            de lo que aportan las colas descartadas, de modo que no se declara
+            convergencia si el redondeo en los extremos la impide.
+    """
+    if a == b:
+        return 0.0, 0.0, 0
+    if a > b:
+        valor, error, evaluaciones = integrar_tanh_sinh(f, b, a, tol, max_niveles, con_distancia)
+        return -valor, error, evaluaciones
+
+    transformar, t_bajo, t_alto = _transformacion_doble_exponencial(a, b)
+    evaluaciones = 0
+    # Término del nodo más externo conservado de cada lado, (t, |término|):
+    # su tamaño acota lo que se pierde más allá de él.
+    borde_bajo = [math.inf, 0.0]
+    borde_alto = [-math.inf, 0.0]
+
+    def termino(t):
+        nonlocal evaluaciones
+        x, peso, distancia = transformar(t)
+        # Puntos que el redondeo lleva hasta un extremo finito aportan menos que la precisión:
+        if peso == 0 or distancia == 0 or (not con_distancia and (x == a or x == b)):
+            return 0.0
+        evaluaciones += 1
+        valor = peso * (f(x, distancia) if con_distancia else f(x))
+        if t <= borde_bajo[0]:
+            borde_bajo[:] = [t, abs(valor)]
+        if t >= borde_alto[0]:
+            borde_alto[:] = [t, abs(valor)]
+        return valor
+
+    # Nivel 0: paso h = 1 en [t_bajo, t_alto].
+    h = 1.0
+    enteros = range(int(t_bajo), int(t_alto) + 1)
+    terminos = [termino(float(k)) for k in enteros]
+    suma = math.fsum(terminos)
+    valor = h * suma
+
+    # Recortamos las colas donde los términos ya son despreciables (cada lado por separado):
+    mayor = max(abs(v) for v in terminos)
+    significativos = [k for k, v in zip(enteros, terminos) if abs(v) > 1e-18 * mayor] or [0]
+    t_bajo = max(t_bajo, min(significativos) - 1)
+    t_alto = min(t_alto, max(significativos) + 1)
+
+    error = math.inf
+    error_previo = None
+    for _ in range(max_niveles):
+        # Los nuevos nodos son los múltiplos impares del nuevo paso:
+        h /= 2
+        primero = math.ceil(t_bajo / h)
+        primero += primero % 2 == 0
+        nuevos = [termino(k * h) for k in range(primero, math.floor(t_alto / h) + 1, 2)]
+        suma = math.fsum([suma] + nuevos)
+        valor_nuevo = h * suma
+        diferencia = abs(valor_nuevo - valor)
+        valor = valor_nuevo
+        # La convergencia es cuadrática en el número de niveles: el error del nivel
+        # actual es del orden de (diferencia actual)^2 / (diferencia anterior).
+        # Solo se confía en esa extrapolación cuando las diferencias ya decrecen.
+        if error_previo and diferencia < error_previo:
+            error = min(diferencia, diferencia ** 2 / error_previo)
+        else:
+            error = diferencia
+        error_previo = diferencia
+        # Lo descartado más allá de los nodos extremos no puede ser menor que su término:
+        error = max(error, borde_bajo[1], borde_alto[1])
+        if error <= tol * max(1.0, abs(valor)):
+            break
+
+    return valor, error, evaluaciones
 
 
 if __name__ == "__main__":
@@ -1,12 +1,34 @@
 import math
 
+import diferenciacion_automatica as da
+
+# numpy es opcional: solo lo necesita la variante por lotes.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Códigos de estado por elemento para newton_raphson_lote:
+ESTADO_CONVERGIO = 0
+ESTADO_MAX_ITERACIONES = 1
+ESTADO_DERIVADA_NULA = 2
+ESTADO_NO_FINITO = 3
+
+def _error_relativo(x_nuevo, x_actual):
+    """Error relativo entre dos iteraciones; absoluto si x_nuevo es cero."""
+    if x_nuevo != 0:
+        return abs((x_nuevo - x_actual) / x_nuevo)
+    return abs(x_nuevo - x_actual)
+
 
 def newton_raphson(f, df, x0, er, n, mostrar_proceso=True):
     """Algoritmo de Newton-Raphson.
 
     Args:
         f (callable): función objetivo para la cual se busca la raíz.
-        df (callable): derivada de la función objetivo.
+        df (callable o None): derivada de la función objetivo. Si es None, f y f'
+            se obtienen juntas por diferenciación automática (f debe usar las
+            funciones de `diferenciacion_automatica` en lugar de las de `math`).
         x0 (float): aproximación inicial a la raíz.
         er (float): cota máxima del error relativo permitido.
         n (int): número máximo de iteraciones para evitar bucles infinitos.
@@ -29,51 +51,216 @@ def newton_raphson(f, df, x0, er, n, mostrar_proceso=True):
         print(f"{'Iter':<6} {'x_actual':<15} {'f(x)':<15} {'f\'(x)':<15} {'x_nuevo':<15} {'Error':<15}")
         print("-"*70)
     
-    # Inicialización de variables de control:
-    # Definimos el error relativo inicial como 1.0 (100%):
+    # La iteración la hace el motor común `metodo_abierto` (estrategia "newton");
+    # aquí solo se imprime la tabla con la derivada de cada paso:
+    exacta = []
+
+    def registrar(i, x_actual, fx, x_nuevo, ei, memoria):
+        if x_nuevo is None:
+            exacta.append(i)
+            print(f"{i:<6} {x_actual:<15.7f} {fx:<15.7f} {'Raíz exacta':<15} {'-':<15} {'0.0000':<15}")
+            print("-"*70)
+            print(f"\n¡Raíz exacta encontrada en la iteración {i}!")
+            return
+        dfx = memoria["dfx"]
+        print(f"{i:<6} {x_actual:<15.7f} {fx:<15.7f} {dfx:<15.7f} {x_nuevo:<15.7f} {ei:<15.7f}")
+        if i == 0:
+            print(f"        Fórmula: x_{i+1} = x_{i} - f(x_{i})/f'(x_{i})")
+            print(f"                 x_{i+1} = {x_actual:.7f} - {fx:.7f}/{dfx:.7f}")
+            print(f"                 x_{i+1} = {x_nuevo:.7f}")
+
+    x_actual, ei, conteo = metodo_abierto(
+        f, x0, er, n, "newton", df=df, mostrar_proceso=False,
+        al_iterar=registrar if mostrar_proceso else None,
+    )
+    i = conteo["iteraciones"]
+    if exacta:
+        return x_actual, ei
+
+    # Mostramos resumen final:
+    if mostrar_proceso:
+        print("-"*70)
+        if ei <= er:
+            print(f"\n✓ Convergencia alcanzada en {i} iteraciones")
+        else:
+            print(f"\n⚠ Límite de iteraciones alcanzado ({n} iteraciones)")
+        print(f"Raíz aproximada: {x_actual:.7f}")
+        print(f"Error relativo final: {ei:.7f}")
+        print("="*70)
+
+    # Devolvemos la mejor aproximación y el error alcanzado:
+    return x_actual, ei
+
+
+def newton_raphson_lote(f, df, x0, er, n):
+    """Algoritmo de Newton-Raphson sobre un arreglo de aproximaciones iniciales.
+
+    Todas las iteraciones avanzan juntas con operaciones de numpy: f y df se
+    llaman una sola vez por iteración sobre los elementos activos. Los elementos
+    que convergen, anulan la derivada o producen valores no finitos se congelan
+    con una máscara en lugar de lanzar una excepción.
+
+    Args:
+        f (callable): función objetivo, compatible con arreglos de numpy.
+        df (callable o None): derivada de la función objetivo, compatible con arreglos
+            de numpy. Si es None se usa diferenciación automática.
+        x0 (array_like): aproximaciones iniciales.
+        er (float): cota máxima del error relativo permitido.
+        n (int): número máximo de iteraciones.
+
+    Returns:
+        tuple: `(raices, errores, iteraciones, estados)` como arreglos de numpy con
+            la forma de `x0`. `estados` usa las constantes `ESTADO_*` del módulo.
+    """
+    if np is None:
+        raise ImportError("newton_raphson_lote requiere numpy.")
+
+    x0 = np.asarray(x0, dtype=float)
+    raices = x0.ravel().copy()
+    errores = np.ones_like(raices)
+    iteraciones = np.zeros(raices.shape, dtype=int)
+    estados = np.full(raices.shape, ESTADO_MAX_ITERACIONES, dtype=int)
+    activos = np.ones(raices.shape, dtype=bool)
+
+    i = 0
+    while i < n and activos.any():
+        idx = np.flatnonzero(activos)
+        x_actual = raices[idx]
+        if df is None:
+            fx, dfx = da.valor_y_derivada(f, x_actual)
+        else:
+            fx, dfx = f(x_actual), df(x_actual)
+        fx = np.broadcast_to(np.asarray(fx, dtype=float), x_actual.shape)
+        dfx = np.broadcast_to(np.asarray(dfx, dtype=float), x_actual.shape)
+
+        # Raíz exacta: se congela con error cero.
+        exacta = fx == 0
+        # Derivada nula: el paso de Newton no está definido.
+        nula = ~exacta & (dfx == 0)
+        paso = ~exacta & ~nula
+
+        x_nuevo = x_actual.copy()
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            x_nuevo[paso] = x_actual[paso] - fx[paso] / dfx[paso]
+            divisor = np.where(x_nuevo != 0, np.abs(x_nuevo), 1.0)
+            ei = np.abs(x_nuevo - x_actual) / divisor
+
+        no_finito = paso & ~np.isfinite(x_nuevo)
+        avanza = paso & ~no_finito
+
+        raices[idx[avanza]] = x_nuevo[avanza]
+        errores[idx[avanza]] = ei[avanza]
+        errores[idx[exacta]] = 0.0
+        iteraciones[idx[avanza]] += 1
+
+        convergio = exacta | (avanza & (ei <= er))
+        estados[idx[convergio]] = ESTADO_CONVERGIO
+        estados[idx[nula]] = ESTADO_DERIVADA_NULA
+        estados[idx[no_finito]] = ESTADO_NO_FINITO
+        activos[idx[convergio | nula | no_finito]] = False
+        i += 1
+
+    forma = x0.shape
+    return raices.reshape(forma), errores.reshape(forma), iteraciones.reshape(forma), estados.reshape(forma)
+
+def newton_seguro(f, df, a, b, er, n, mostrar_proceso=True):
+    """Algoritmo de Newton-Raphson protegido con bisección (rtsafe).
+
+    Mantiene un intervalo [a, b] con cambio de signo. En cada iteración toma el
+    paso de Newton si cae dentro del intervalo y lo reduce lo suficiente; si no
+    (o si la derivada se anula) toma un paso de bisección. Converge siempre y
+    recupera la velocidad cuadrática de Newton cerca de la raíz.
+
+    Args:
+        f (callable): función objetivo para la cual se busca la raíz.
+        df (callable o None): derivada de la función objetivo. Si es None se usa
+            diferenciación automática.
+        a, b (float): extremos del intervalo donde f cambia de signo.
+        er (float): cota máxima del error relativo permitido.
+        n (int): número máximo de iteraciones.
+        mostrar_proceso (bool): si es True, muestra el proceso de cálculo paso a paso.
+
+    Returns:
+        tuple: par `(raiz_aproximada, error_final)`.
+    """
+    def evaluar(x):
+        if df is None:
+            return da.valor_y_derivada(f, x)
+        return f(x), df(x)
+
+    fa = f(a)
+    fb = f(b)
+    # Validamos que exista cambio de signo, igual que en la bisección:
+    if fa * fb > 0:
+        raise ValueError("La funcion no cambia de signo en el intervalo dado.")
+    if fa == 0:
+        return a, 0.0
+    if fb == 0:
+        return b, 0.0
+
+    # Orientamos el intervalo para que f(x_bajo) < 0 < f(x_alto):
+    if fa < 0:
+        x_bajo, x_alto = a, b
+    else:
+        x_bajo, x_alto = b, a
+
+    if mostrar_proceso:
+        print("\n" + "="*70)
+        print("MÉTODO DE NEWTON-RAPHSON PROTEGIDO (NEWTON + BISECCIÓN)")
+        print("="*70)
+        print(f"Intervalo inicial: [a, b] = [{a}, {b}]")
+        print(f"Error máximo permitido (er): {er}")
+        print(f"Número máximo de iteraciones (n): {n}")
+        print("-"*70)
+        print(f"{'Iter':<6} {'x_actual':<15} {'f(x)':<15} {'Paso':<15} {'x_nuevo':<15} {'Error':<15}")
+        print("-"*70)
+
+    x_actual = (a + b) / 2
+    dx_anterior = abs(b - a)
+    dx = dx_anterior
+    fx, dfx = evaluar(x_actual)
     ei = 1.0
-    # Iniciamos el contador de iteraciones:
     i = 0
-    # Guardamos la estimación actual (comienza con el valor inicial x0):
-    x_actual = x0
 
-    # Bucle principal de iteración:
-    while ei > er and i < n:
-        fx = f(x_actual)
-        # Si encontramos una raíz exacta, terminamos inmediatamente:
+    while i < n:
         if fx == 0:
             if mostrar_proceso:
-                print(f"{i:<6} {x_actual:<15.7f} {fx:<15.7f} {'Raíz exacta':<15} {'-':<15} {'0.0000':<15}")
                 print("-"*70)
                 print(f"\n¡Raíz exacta encontrada en la iteración {i}!")
             return x_actual, 0.0
 
-        dfx = df(x_actual)
-        # Validamos que la derivada no sea cero para evitar divisiones no válidas:
-        if dfx == 0:
-            raise ValueError("La derivada se anuló; el método no puede continuar.")
-
-        # Calculamos la nueva aproximación usando la fórmula de Newton-Raphson:
-        x_nuevo = x_actual - fx / dfx
-
-        # Actualizamos el error relativo si el nuevo valor no es cero:
-        if x_nuevo != 0:
-            ei = abs((x_nuevo - x_actual) / x_nuevo)
+        # El paso de Newton se rechaza si sale del intervalo o si no reduce
+        # el paso a menos de la mitad del anterior (incluye derivada nula):
+        fuera = ((x_actual - x_alto) * dfx - fx) * ((x_actual - x_bajo) * dfx - fx) > 0
+        lento = abs(2 * fx) > abs(dx_anterior * dfx)
+        dx_anterior = dx
+        if fuera or lento:
+            dx = (x_alto - x_bajo) / 2
+            x_nuevo = x_bajo + dx
+            paso = "bisección"
         else:
-            ei = abs(x_nuevo - x_actual)
+            dx = fx / dfx
+            x_nuevo = x_actual - dx
+            paso = "Newton"
+
+        ei = abs(dx / x_nuevo) if x_nuevo != 0 else abs(dx)
 
-        # Mostramos la iteración actual:
         if mostrar_proceso:
-            print(f"{i:<6} {x_actual:<15.7f} {fx:<15.7f} {dfx:<15.7f} {x_nuevo:<15.7f} {ei:<15.7f}")
-            if i == 0:
-                print(f"        Fórmula: x_{i+1} = x_{i} - f(x_{i})/f'(x_{i})")
-                print(f"                 x_{i+1} = {x_actual:.7f} - {fx:.7f}/{dfx:.7f}")
-                print(f"                 x_{i+1} = {x_nuevo:.7f}")
+            print(f"{i:<6} {x_actual:<15.7f} {fx:<15.7f} {paso:<15} {x_nuevo:<15.7f} {ei:<15.7f}")
 
-        # Preparamos la siguiente iteración:
         x_actual = x_nuevo
         i += 1
 
+        if ei <= er:
+            break
+
+        fx, dfx = evaluar(x_actual)
+        # Actualizamos el intervalo con el signo del nuevo punto:
+        if fx < 0:
+            x_bajo = x_actual
+        else:
+            x_alto = x_actual
+
     # Mostramos resumen final:
     if mostrar_proceso:
         print("-"*70)
@@ -85,9 +272,178 @@ def newton_raphson(f, df, x0, er, n, mostrar_proceso=True):
         print(f"Error relativo final: {ei:.7f}")
         print("="*70)
 
-    # Una vez terminado el bucle, devolvemos la mejor aproximación y el error alcanzado:
     return x_actual, ei
 
+class _Evaluador:
+    """Envuelve f y sus derivadas contando cuántas veces se evalúa cada una."""
+
+    def __init__(self, f, df=None, d2f=None):
+        self._f = f
+        self._df = df
+        self._d2f = d2f
+        self.conteo = {"f": 0, "df": 0, "d2f": 0}
+
+    def f(self, x):
+        self.conteo["f"] += 1
+        return self._f(x)
+
+    def f_y_df(self, x):
+        if self._df is None:
+            # Diferenciación automática: una sola evaluación de f.
+            self.conteo["f"] += 1
+            return da.valor_y_derivada(self._f, x)
+        fx = self.f(x)
+        self.conteo["df"] += 1
+        return fx, self._df(x)
+
+    def d2f(self, x):
+        if self._d2f is None:
+            raise ValueError("El método de Halley requiere la segunda derivada d2f.")
+        self.conteo["d2f"] += 1
+        return self._d2f(x)
+
+
+# Cada estrategia recibe el evaluador, la iteración actual y un diccionario de
+# memoria propio; devuelve `(f(x_actual), x_nuevo)`.
+
+def _paso_newton(ev, x, memoria):
+    fx, dfx = ev.f_y_df(x)
+    memoria["dfx"] = dfx
+    if fx == 0:
+        return fx, x
+    if dfx == 0:
+        raise ValueError("La derivada se anuló; el método no puede continuar.")
+    return fx, x - fx / dfx
+
+
+def _paso_halley(ev, x, memoria):
+    fx, dfx = ev.f_y_df(x)
+    if fx == 0:
+        return fx, x
+    d2fx = ev.d2f(x)
+    denominador = 2 * dfx * dfx - fx * d2fx
+    if denominador == 0:
+        raise ValueError("El denominador de Halley se anuló; el método no puede continuar.")
+    return fx, x - 2 * fx * dfx / denominador
+
+
+def _paso_secante(ev, x, memoria):
+    fx = ev.f(x)
+    if fx == 0:
+        return fx, x
+    if "x_anterior" in memoria:
+        x_anterior, f_anterior = memoria["x_anterior"], memoria["f_anterior"]
+    else:
+        # Primer paso: usamos x1 o un punto auxiliar muy cercano a x0.
+        x_anterior = memoria["x1"] if memoria["x1"] is not None else x + 1e-4 * (abs(x) or 1.0)
+        f_anterior = ev.f(x_anterior)
+    denominador = fx - f_anterior
+    if denominador == 0:
+        raise ValueError("La pendiente de la secante se anuló; el método no puede continuar.")
+    memoria["x_anterior"], memoria["f_anterior"] = x, fx
+    return fx, x - fx * (x - x_anterior) / denominador
+
+
+def _paso_steffensen(ev, x, memoria):
+    fx = ev.f(x)
+    if fx == 0:
+        return fx, x
+    if x + fx == x:
+        # El paso de prueba ya no cambia x: convergencia a precisión de máquina.
+        return fx, x
+    denominador = ev.f(x + fx) - fx
+    if denominador == 0:
+        raise ValueError("El denominador de Steffensen se anuló; el método no puede continuar.")
+    return fx, x - fx * fx / denominador
+
+
+METODOS_ABIERTOS = {
+    "newton": _paso_newton,
+    "halley": _paso_halley,
+    "secante": _paso_secante,
+    "steffensen": _paso_steffensen,
+}
+
+
+def metodo_abierto(f, x0, er, n, metodo="newton", df=None, d2f=None, x1=None, mostrar_proceso=True,
+                   al_iterar=None):
+    """Motor común para métodos abiertos de punto fijo (Newton, Halley, secante, Steffensen).
+
+    Todas las estrategias comparten el criterio de parada, la métrica de error
+    relativo y el conteo de evaluaciones, de modo que se pueden comparar por el
+    número de llamadas a f, f' y f''.
+
+    Args:
+        f (callable): función objetivo.
+        x0 (float): aproximación inicial a la raíz.
+        er (float): cota máxima del error relativo permitido.
+        n (int): número máximo de iteraciones.
+        metodo (str): "newton", "halley", "secante" o "steffensen".
+        df (callable o None): derivada de f (Newton y Halley). Si es None se usa
+            diferenciación automática.
+        d2f (callable o None): segunda derivada de f (obligatoria para Halley).
+        x1 (float, optional): segundo punto inicial para la secante.
+        mostrar_proceso (bool): si es True, muestra el proceso de cálculo paso a paso.
+        al_iterar (callable, optional): se llama en cada iteración con
+            `(i, x_actual, f(x_actual), x_nuevo, error, memoria)`, donde `memoria`
+            guarda los valores intermedios del paso (por ejemplo "dfx" en Newton).
+            Si se encuentra una raíz exacta se llama con `x_nuevo = None`.
+
+    Returns:
+        tuple: `(raiz_aproximada, error_final, conteo)` donde `conteo` es un
+            diccionario con las claves "iteraciones", "f", "df" y "d2f".
+    """
+    if metodo not in METODOS_ABIERTOS:
+        raise ValueError("Método no reconocido. Use: " + ", ".join(f"'{m}'" for m in METODOS_ABIERTOS) + ".")
+    paso = METODOS_ABIERTOS[metodo]
+    ev = _Evaluador(f, df, d2f)
+    memoria = {"x1": x1}
+
+    if mostrar_proceso:
+        print("\n" + "="*70)
+        print(f"MÉTODO ABIERTO: {metodo.upper()}")
+        print("="*70)
+        print(f"Aproximación inicial (x0): {x0}")
+        print(f"Error máximo permitido (er): {er}")
+        print(f"Número máximo de iteraciones (n): {n}")
+        print("-"*70)
+        print(f"{'Iter':<6} {'x_actual':<15} {'f(x)':<15} {'x_nuevo':<15} {'Error':<15}")
+        print("-"*70)
+
+    ei = 1.0
+    i = 0
+    x_actual = x0
+    while ei > er and i < n:
+        fx, x_nuevo = paso(ev, x_actual, memoria)
+        if fx == 0:
+            if al_iterar is not None:
+                al_iterar(i, x_actual, fx, None, 0.0, memoria)
+            if mostrar_proceso:
+                print("-"*70)
+                print(f"\n¡Raíz exacta encontrada en la iteración {i}!")
+            return x_actual, 0.0, dict(ev.conteo, iteraciones=i)
+
+        ei = _error_relativo(x_nuevo, x_actual)
+        if al_iterar is not None:
+            al_iterar(i, x_actual, fx, x_nuevo, ei, memoria)
+        if mostrar_proceso:
+            print(f"{i:<6} {x_actual:<15.7f} {fx:<15.7f} {x_nuevo:<15.7f} {ei:<15.7f}")
+        x_actual = x_nuevo
+        i += 1
+
+    # Mostramos resumen final:
+    if mostrar_proceso:
+        print("-"*70)
+        if ei <= er:
+            print(f"\n✓ Convergencia alcanzada en {i} iteraciones")
+        else:
+            print(f"\n⚠ Límite de iteraciones alcanzado ({n} iteraciones)")
+        print(f"Raíz aproximada: {x_actual:.7f}")
+        print(f"Error relativo final: {ei:.7f}")
+        print(f"Evaluaciones: f={ev.conteo['f']}, f'={ev.conteo['df']}, f''={ev.conteo['d2f']}")
+        print("="*70)
+
+    return x_actual, ei, dict(ev.conteo, iteraciones=i)
 
 # Bloque de prueba:
 if __name__ == "__main__":
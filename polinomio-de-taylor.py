@@ -1,6 +1,131 @@
 import math
+import sys
+from fractions import Fraction
+
 import sympy as sp
 
+# Derivadas simbólicas ya calculadas, por expresión y variable: {(f, x): [f, f', f'', ...]}
+_CACHE_DERIVADAS = {}
+# Valores de esas derivadas en un punto: {(f, x, a): [f(a), f'(a), ...]}
+_CACHE_VALORES = {}
+# Plantillas de diferencias finitas por orden máximo: {n: (desplazamientos, pesos)}
+_CACHE_PLANTILLAS = {}
+# Veces que se reduce a la mitad el paso h si la plantilla sale del dominio de f:
+_MAX_REDUCCIONES_PASO = 40
+
+
+def derivadas_simbolicas(f_simbolica, x, k):
+    """Devuelve [f, f', ..., f^(k)] derivando una sola vez cada término.
+    La cadena se guarda en caché y solo se extiende con las derivadas que
+    faltan, de modo que pedir un grado mayor no repite las anteriores.
+
+    Args:
+        f_simbolica (sympy.Expr): expresión de la función.
+        x (sympy.Symbol): variable de derivación.
+        k (int): orden máximo de derivación.
+
+    Returns:
+        list: expresiones de las derivadas de orden 0 a k.
+    """
+    cadena = _CACHE_DERIVADAS.setdefault((f_simbolica, x), [f_simbolica])
+    while len(cadena) <= k:
+        cadena.append(sp.diff(cadena[-1], x))
+    return cadena[:k + 1]
+
+
+def derivadas_en_punto(f_simbolica, x, a, k):
+    """Devuelve [f(a), f'(a), ..., f^(k)(a)] reutilizando los valores en caché.
+
+    Args:
+        f_simbolica (sympy.Expr): expresión de la función.
+        x (sympy.Symbol): variable de derivación.
+        a (float): punto de evaluación.
+        k (int): orden máximo de derivación.
+
+    Returns:
+        list: valores (sympy) de las derivadas de orden 0 a k en a.
+    """
+    cadena = derivadas_simbolicas(f_simbolica, x, k)
+    valores = _CACHE_VALORES.setdefault((f_simbolica, x, sp.sympify(a)), [])
+    while len(valores) <= k:
+        valores.append(cadena[len(valores)].subs(x, a))
+    return valores[:k + 1]
+
+
+class PolinomioTaylor:
+    """Polinomio P(x) = Σ c_k (x - a)^k con coeficientes float.
+    Se evalúa por Horner sobre escalares o arreglos de numpy (una pasada por
+    coeficiente) y ofrece su derivada e integral sin recurrir a sympy; la
+    expresión simbólica solo se construye si se pide, con el centro y los
+    coeficientes exactos cuando se conocen.
+
+    Attributes:
+        coeficientes (tuple): c_0, ..., c_n en potencias de (x - a).
+        a (float): centro de expansión.
+    """
+
+    def __init__(self, coeficientes, a, coeficientes_exactos=None):
+        self.coeficientes = tuple(float(c) for c in coeficientes) or (0.0,)
+        self.a = float(a)
+        # Centro y coeficientes tal como se dieron (p. ej. sp.pi/4 y valores
+        # sympy exactos) para mostrar la expresión:
+        self._a_exacto = a
+        self._exactos = coeficientes_exactos
+        self._expr = None
+
+    @property
+    def grado(self):
+        return len(self.coeficientes) - 1
+
+    def __call__(self, x):
+        """Evalúa el polinomio en x (escalar o arreglo) por el esquema de Horner."""
+        t = x - self.a
+        if self.grado == 0:
+            # Un polinomio constante debe devolver la forma de x:
+            return self.coeficientes[0] + 0 * t
+        resultado = self.coeficientes[-1]
+        for c in reversed(self.coeficientes[:-1]):
+            resultado = resultado * t + c
+        return resultado
+
+    def derivada(self, orden=1):
+        """Polinomio derivada de orden `orden` (mismo centro a)."""
+        coeficientes = self.coeficientes
+        exactos = self._exactos
+        for _ in range(orden):
+            coeficientes = [k * c for k, c in enumerate(coeficientes)][1:] or [0.0]
+            if exactos is not None:
+                exactos = [k * c for k, c in enumerate(exactos)][1:] or [0]
+        return PolinomioTaylor(coeficientes, self._a_exacto, exactos)
+
+    def integral(self, constante=0.0):
+        """Primitiva F con F(a) = constante (mismo centro a)."""
+        coeficientes = [constante] + [c / (k + 1) for k, c in enumerate(self.coeficientes)]
+        exactos = None
+        if self._exactos is not None:
+            exactos = [sp.sympify(constante)] + [sp.sympify(c) / (k + 1) for k, c in enumerate(self._exactos)]
+        return PolinomioTaylor(coeficientes, self._a_exacto, exactos)
+
+    def integral_definida(self, x0, x1):
+        """∫ P(x) dx entre x0 y x1."""
+        primitiva = self.integral()
+        return primitiva(x1) - primitiva(x0)
+
+    @property
+    def expr(self):
+        """Expresión sympy simplificada del polinomio (se calcula una vez)."""
+        if self._expr is None:
+            x = sp.Symbol('x')
+            coeficientes = self._exactos if self._exactos is not None else self.coeficientes
+            self._expr = sp.simplify(sum(c * (x - self._a_exacto) ** k for k, c in enumerate(coeficientes)))
+        return self._expr
+
+    def __str__(self):
+        return str(self.expr)
+
+    def __repr__(self):
+        return f"PolinomioTaylor(coeficientes={self.coeficientes!r}, a={self.a!r})"
+
 
 def polinomio_taylor(f, a, n, x_eval=None, mostrar_proceso=True):
     """Algoritmo para calcular el polinomio de Taylor.
@@ -11,12 +136,15 @@ def polinomio_taylor(f, a, n, x_eval=None, mostrar_proceso=True):
         a (float): punto alrededor del cual se expande el polinomio (centro de expansión).
         n (int): grado del polinomio de Taylor (número de términos - 1).
         x_eval (float, optional): punto donde se desea evaluar el polinomio.
-            Si es None, se retorna la expresión simbólica del polinomio.
+            Si es None, se retorna el polinomio como objeto `PolinomioTaylor`.
         mostrar_proceso (bool): si es True, muestra el proceso de cálculo paso a paso.
 
     Returns:
         tuple: par `(polinomio, error_resto)` donde:
-            - polinomio: expresión simbólica del polinomio o valor numérico si x_eval está definido.
+            - polinomio: `PolinomioTaylor` (evaluable, con `expr` simbólica) o valor
+              numérico si x_eval está definido. Si los coeficientes no son números
+              reales (p. ej. f = e^(k x) con k simbólico) es la expresión sympy
+              simplificada, o su valor simbólico en x_eval.
             - error_resto: estimación del error del resto (término de Lagrange).
     """
     # Definimos la variable simbólica x:
@@ -56,23 +184,27 @@ def polinomio_taylor(f, a, n, x_eval=None, mostrar_proceso=True):
         # Si ya es una expresión simbólica:
         f_simbolica = f
     
-    # Inicializamos el polinomio como cero:
+    # Inicializamos el polinomio como cero (la suma simbólica solo se arma para mostrarla):
     polinomio = 0
+    coeficientes = []
     
     if mostrar_proceso:
         print("\nCálculo de términos del polinomio:")
         print("-"*70)
     
+    # Derivadas f, f', ..., f^(n+1) y sus valores en a (la n+1 es para el resto);
+    # cada una se calcula una sola vez y queda en caché para otras llamadas:
+    derivadas = derivadas_simbolicas(f_simbolica, x, n + 1)
+    valores_en_a = derivadas_en_punto(f_simbolica, x, a, n + 1)
+
     # Calculamos cada término del polinomio de Taylor:
     # P_n(x) = Σ(k=0 to n) [f^(k)(a) / k!] * (x - a)^k
     for k in range(n + 1):
         if mostrar_proceso:
             print(f"\nTérmino k = {k}:")
         
-        # Calculamos la k-ésima derivada de f:
-        f_derivada_k = f_simbolica
-        for _ in range(k):
-            f_derivada_k = sp.diff(f_derivada_k, x)
+        # k-ésima derivada de f (de la cadena ya calculada):
+        f_derivada_k = derivadas[k]
         
         if mostrar_proceso:
             if k == 0:
@@ -80,8 +212,8 @@ def polinomio_taylor(f, a, n, x_eval=None, mostrar_proceso=True):
             else:
                 print(f"  f^({k})(x) = {sp.simplify(f_derivada_k)}")
         
-        # Evaluamos la derivada en el punto a:
-        f_derivada_k_en_a = f_derivada_k.subs(x, a)
+        # Valor de la derivada en el punto a:
+        f_derivada_k_en_a = valores_en_a[k]
         
         if mostrar_proceso:
             print(f"  f^({k})({a}) = {f_derivada_k_en_a}")
@@ -89,22 +221,26 @@ def polinomio_taylor(f, a, n, x_eval=None, mostrar_proceso=True):
         
         # Calculamos el término: [f^(k)(a) / k!] * (x - a)^k
         coeficiente = f_derivada_k_en_a / math.factorial(k)
-        termino = coeficiente * (x - a)**k
+        coeficientes.append(coeficiente)
         
         if mostrar_proceso:
+            termino = coeficiente * (x - a)**k
             termino_simplificado = sp.simplify(termino)
             print(f"  Término {k}: [{f_derivada_k_en_a} / {math.factorial(k)}] * (x - {a})^{k}")
             print(f"            = {termino_simplificado}")
-        
-        # Sumamos el término al polinomio:
-        polinomio += termino
-        
-        if mostrar_proceso:
+            
+            # Sumamos el término al polinomio:
+            polinomio += termino
             polinomio_actual = sp.simplify(polinomio)
             print(f"  Polinomio acumulado: P_{k}(x) = {polinomio_actual}")
     
-    # Simplificamos el polinomio:
-    polinomio = sp.simplify(polinomio)
+    # Polinomio con coeficientes float (la simplificación simbólica es perezosa):
+    try:
+        polinomio = PolinomioTaylor(coeficientes, a, coeficientes_exactos=coeficientes)
+    except TypeError:
+        # Coeficientes con parámetros simbólicos o complejos: no hay versión float,
+        # así que se conserva la expresión exacta de sympy:
+        polinomio = sp.simplify(sum(c * (x - a)**k for k, c in enumerate(coeficientes)))
     
     if mostrar_proceso:
         print("\n" + "-"*70)
@@ -112,6 +248,19 @@ def polinomio_taylor(f, a, n, x_eval=None, mostrar_proceso=True):
         print(f"P_{n}(x) = {polinomio}")
         print("-"*70)
     
+    if not isinstance(polinomio, PolinomioTaylor):
+        if x_eval is None:
+            return polinomio, None
+        # Valor y resto quedan como expresiones sympy:
+        polinomio_evaluado = sp.simplify(polinomio.subs(x, x_eval))
+        error_resto = sp.simplify(sp.Abs(valores_en_a[n + 1]) / math.factorial(n + 1) * sp.Abs(x_eval - a)**(n + 1))
+        if mostrar_proceso:
+            print(f"\nEVALUACIÓN DEL POLINOMIO EN x = {x_eval}:")
+            print("-"*70)
+            print(f"P_{n}({x_eval}) = {polinomio_evaluado}")
+            print(f"  Error estimado: R_{n}({x_eval}) = {error_resto}")
+        return polinomio_evaluado, error_resto
+    
     # Calculamos el error del resto (término de Lagrange):
     # R_n(x) = [f^(n+1)(ξ) / (n+1)!] * (x - a)^(n+1)
     # Para estimar, usamos la derivada (n+1)-ésima evaluada en un punto intermedio:
@@ -121,7 +270,7 @@ def polinomio_taylor(f, a, n, x_eval=None, mostrar_proceso=True):
             print("-"*70)
         
         # Evaluamos el polinomio en x_eval:
-        polinomio_evaluado = float(polinomio.subs(x, x_eval))
+        polinomio_evaluado = polinomio(x_eval)
         
         if mostrar_proceso:
             print(f"P_{n}({x_eval}) = {polinomio_evaluado:.7f}")
@@ -130,9 +279,7 @@ def polinomio_taylor(f, a, n, x_eval=None, mostrar_proceso=True):
         if mostrar_proceso:
             print(f"\nCálculo del error del resto (término de Lagrange):")
         
-        f_derivada_n1 = f_simbolica
-        for _ in range(n + 1):
-            f_derivada_n1 = sp.diff(f_derivada_n1, x)
+        f_derivada_n1 = derivadas[n + 1]
         
         if mostrar_proceso:
             print(f"  f^({n+1})(x) = {sp.simplify(f_derivada_n1)}")
@@ -140,7 +287,7 @@ def polinomio_taylor(f, a, n, x_eval=None, mostrar_proceso=True):
         # Estimamos el error usando el valor máximo posible de la derivada:
         # (simplificación: usamos el valor en a como aproximación)
         try:
-            max_derivada = abs(float(f_derivada_n1.subs(x, a)))
+            max_derivada = abs(float(valores_en_a[n + 1]))
             if mostrar_proceso:
                 print(f"  |f^({n+1})({a})| = {max_derivada:.7f}")
         except:
@@ -157,7 +304,7 @@ def polinomio_taylor(f, a, n, x_eval=None, mostrar_proceso=True):
         
         return polinomio_evaluado, error_resto
     else:
-        # Si no se especifica x_eval, retornamos el polinomio simbólico:
+        # Si no se especifica x_eval, retornamos el polinomio como objeto:
         return polinomio, None
 
 
@@ -172,10 +319,12 @@ def polinomio_taylor_numerico(f, a, n, x_eval=None, mostrar_proceso=True):
         mostrar_proceso (bool): si es True, muestra el proceso de cálculo paso a paso.
 
     Returns:
-        tuple: par `(polinomio_func, error_resto)` donde polinomio_func es una función lambda.
+        tuple: par `(polinomio, error_resto)` donde polinomio es un
+            `PolinomioTaylor` (invocable) o su valor en x_eval.
     """
-    # Usamos diferencias finitas para aproximar las derivadas:
-    h = 1e-5  # Paso pequeño para la aproximación numérica
+    # Las derivadas f(a), ..., f^(n+1)(a) (la n+1 es para el resto) salen de una
+    # sola plantilla de diferencias finitas, evaluando f una vez por nodo:
+    derivadas, h = _derivadas_con_paso(f, a, n + 1)
     
     if mostrar_proceso:
         print("\n" + "="*70)
@@ -190,33 +339,28 @@ def polinomio_taylor_numerico(f, a, n, x_eval=None, mostrar_proceso=True):
         print("\nCálculo de términos del polinomio:")
         print("-"*70)
     
-    # Construimos el polinomio término por término:
-    def polinomio_func(x_val):
-        resultado = 0.0
-        for k in range(n + 1):
-            # Aproximamos la k-ésima derivada usando diferencias finitas:
-            if k == 0:
-                derivada_k = f(a)
-            else:
-                # Aproximación de la derivada k-ésima usando diferencias finitas centrales:
-                derivada_k = aproximar_derivada_k(f, a, k, h)
-            
-            if mostrar_proceso:
-                print(f"\nTérmino k = {k}:")
-                print(f"  f^({k})({a}) ≈ {derivada_k:.7f}")
-                print(f"  {k}! = {math.factorial(k)}")
-            
-            # Calculamos el término del polinomio:
-            coeficiente = derivada_k / math.factorial(k)
-            termino = coeficiente * ((x_val - a)**k)
-            resultado += termino
-            
-            if mostrar_proceso:
-                print(f"  Término {k}: [{derivada_k:.7f} / {math.factorial(k)}] * ({x_val} - {a})^{k}")
-                print(f"            = {coeficiente:.7f} * {((x_val - a)**k):.7f} = {termino:.7f}")
-                print(f"  Polinomio acumulado: P_{k}({x_val}) = {resultado:.7f}")
+    # Construimos el polinomio término por término (una sola vez):
+    coeficientes = []
+    resultado = 0.0
+    for k in range(n + 1):
+        derivada_k = derivadas[k]
+        coeficiente = derivada_k / math.factorial(k)
+        coeficientes.append(coeficiente)
         
-        return resultado
+        if mostrar_proceso:
+            print(f"\nTérmino k = {k}:")
+            print(f"  f^({k})({a}) ≈ {derivada_k:.7f}")
+            print(f"  {k}! = {math.factorial(k)}")
+            if x_eval is not None:
+                termino = coeficiente * ((x_eval - a)**k)
+                resultado += termino
+                print(f"  Término {k}: [{derivada_k:.7f} / {math.factorial(k)}] * ({x_eval} - {a})^{k}")
+                print(f"            = {coeficiente:.7f} * {((x_eval - a)**k):.7f} = {termino:.7f}")
+                print(f"  Polinomio acumulado: P_{k}({x_eval}) = {resultado:.7f}")
+            else:
+                print(f"  Coeficiente {k}: {coeficiente:.7f}")
+    
+    polinomio = PolinomioTaylor(coeficientes, a)
     
     # Calculamos el error del resto:
     if x_eval is not None:
@@ -225,14 +369,14 @@ def polinomio_taylor_numerico(f, a, n, x_eval=None, mostrar_proceso=True):
             print(f"EVALUACIÓN DEL POLINOMIO EN x = {x_eval}:")
             print("-"*70)
         
-        valor_aprox = polinomio_func(x_eval)
+        valor_aprox = polinomio(x_eval)
         
         if mostrar_proceso:
             print(f"\nP_{n}({x_eval}) = {valor_aprox:.7f}")
             print(f"\nCálculo del error del resto:")
         
-        # Aproximamos la derivada (n+1)-ésima:
-        derivada_n1 = aproximar_derivada_k(f, a, n + 1, h)
+        # Derivada (n+1)-ésima (ya calculada con las demás):
+        derivada_n1 = derivadas[n + 1]
         
         if mostrar_proceso:
             print(f"  f^({n+1})({a}) ≈ {derivada_n1:.7f}")
@@ -246,32 +390,160 @@ def polinomio_taylor_numerico(f, a, n, x_eval=None, mostrar_proceso=True):
         
         return valor_aprox, error_resto
     else:
-        return polinomio_func, None
+        return polinomio, None
+
+
+def _pesos_fornberg(desplazamientos, m):
+    """Pesos exactos de diferencias finitas (algoritmo de Fornberg).
+
+    Args:
+        desplazamientos (list): nodos enteros z_j (en unidades de h) alrededor de 0.
+        m (int): orden máximo de derivación.
+
+    Returns:
+        list: `pesos[k][j]` (Fraction) tal que f^(k)(a) ≈ Σ_j pesos[k][j] f(a + z_j h) / h^k.
+    """
+    z = [Fraction(v) for v in desplazamientos]
+    pesos = [[Fraction(0)] * len(z) for _ in range(m + 1)]
+    pesos[0][0] = Fraction(1)
+    c1 = Fraction(1)
+    c4 = z[0]
+    for i in range(1, len(z)):
+        mn = min(i, m)
+        c2 = Fraction(1)
+        c5 = c4
+        c4 = z[i]
+        for j in range(i):
+            c3 = z[i] - z[j]
+            c2 *= c3
+            if j == i - 1:
+                for k in range(mn, 0, -1):
+                    pesos[k][i] = c1 * (k * pesos[k - 1][i - 1] - c5 * pesos[k][i - 1]) / c2
+                pesos[0][i] = -c1 * c5 * pesos[0][i - 1] / c2
+            for k in range(mn, 0, -1):
+                pesos[k][j] = (c4 * pesos[k][j] - k * pesos[k - 1][j]) / c3
+            pesos[0][j] = c4 * pesos[0][j] / c3
+        c1 = c2
+    return pesos
+
+
+def plantilla_diferencias(n):
+    """Nodos y pesos compartidos para las derivadas de orden 0 a n.
+    Para cada orden k se combina la plantilla central de paso h (nodos -p..p,
+    con p = ceil(n/2), unos n+1 nodos) con la misma plantilla de paso h/2
+    mediante una extrapolación de Richardson que cancela el término principal
+    del error. La plantilla de paso h/2 reutiliza los nodos enteros y solo
+    agrega los semienteros de [-p/2, p/2], así que no se aleja más de p*h de a.
+    Los pesos se calculan en aritmética racional exacta y se guardan en caché.
+
+    Args:
+        n (int): orden máximo de derivación.
+
+    Returns:
+        tuple: `(desplazamientos, pesos)` donde `pesos[k]` son los coeficientes
+            float de la derivada k sobre `desplazamientos` (en unidades de h).
+    """
+    if n in _CACHE_PLANTILLAS:
+        return _CACHE_PLANTILLAS[n]
+    p = (n + 1) // 2
+    grueso = list(range(-p, p + 1))
+    desplazamientos = sorted(set(Fraction(z) for z in grueso) | {Fraction(z, 2) for z in grueso})
+    posicion = {z: i for i, z in enumerate(desplazamientos)}
+    base = _pesos_fornberg(grueso, n)
+
+    pesos = []
+    for k in range(n + 1):
+        combinados = [Fraction(0)] * len(desplazamientos)
+        if k == 0:
+            combinados[posicion[0]] = Fraction(1)
+            pesos.append(tuple(float(w) for w in combinados))
+            continue
+        # Orden q del error: primer momento Σ w_j z_j^m (m > k) que no se anula.
+        m = k + 1
+        while sum(w * Fraction(z) ** m for w, z in zip(base[k], grueso)) == 0:
+            m += 1
+        factor = Fraction(2) ** (m - k)
+        for w, z in zip(base[k], grueso):
+            # Paso h/2: nodo z/2 con el peso reescalado por 2^k.
+            combinados[posicion[Fraction(z, 2)]] += factor * w * 2 ** k / (factor - 1)
+            combinados[posicion[Fraction(z)]] -= w / (factor - 1)
+        pesos.append(tuple(float(w) for w in combinados))
+
+    _CACHE_PLANTILLAS[n] = (tuple(float(z) for z in desplazamientos), tuple(pesos))
+    return _CACHE_PLANTILLAS[n]
+
+
+def paso_diferencias(n):
+    """Paso h que equilibra el error de truncamiento y el de redondeo hasta el orden n.
+    Con la extrapolación de Richardson el truncamiento de la derivada n es de
+    orden h^4 o mayor, y la plantilla de paso h/2 amplifica el redondeo por
+    2^n; de ahí h = (2^n eps)^(1/(n + 4)). El paso no depende del centro a:
+    escalarlo con |a| alejaba la plantilla del dominio de f.
+    """
+    return (2 ** n * sys.float_info.epsilon) ** (1 / (n + 4))
+
+
+def _muestrear(f, a, desplazamientos, h):
+    """Evalúa f en a + z*h; si algún nodo cae fuera del dominio de f (error de
+    dominio o valor no finito) reduce h a la mitad y vuelve a intentarlo.
+
+    Returns:
+        tuple: `(valores, h)` con el paso finalmente usado.
+    """
+    for _ in range(_MAX_REDUCCIONES_PASO):
+        try:
+            valores = [f(a + z * h) for z in desplazamientos]
+            if all(math.isfinite(v) for v in valores):
+                return valores, h
+        except (ValueError, ZeroDivisionError, OverflowError):
+            pass
+        h /= 2
+    raise ValueError(f"No se pudo evaluar f alrededor de a = {a}: el punto parece estar fuera de su dominio.")
+
+
+def _derivadas_con_paso(f, a, n, h=None):
+    """Como `aproximar_derivadas`, pero devuelve también el paso usado."""
+    desplazamientos, pesos = plantilla_diferencias(n)
+    if h is None:
+        valores, h = _muestrear(f, a, desplazamientos, paso_diferencias(n))
+    else:
+        valores = [f(a + z * h) for z in desplazamientos]
+    derivadas = [math.fsum(w * v for w, v in zip(pesos[k], valores)) / h ** k for k in range(n + 1)]
+    return derivadas, h
+
 
+def aproximar_derivadas(f, a, n, h=None):
+    """Aproxima f(a), f'(a), ..., f^(n)(a) con un único conjunto de evaluaciones de f.
+
+    Args:
+        f (callable): función objetivo.
+        a (float): punto donde se evalúan las derivadas.
+        n (int): orden máximo de derivación.
+        h (float, optional): paso; si es None se elige con `paso_diferencias`
+            y se reduce si la plantilla sale del dominio de f.
 
-def aproximar_derivada_k(f, a, k, h):
+    Returns:
+        list: aproximaciones de las derivadas de orden 0 a n.
+    """
+    return _derivadas_con_paso(f, a, n, h)[0]
+
+
+def aproximar_derivada_k(f, a, k, h=None):
     """Aproxima la k-ésima derivada de f en el punto a usando diferencias finitas.
 
     Args:
         f (callable): función objetivo.
         a (float): punto donde se evalúa la derivada.
         k (int): orden de la derivada.
-        h (float): paso para la aproximación.
+        h (float, optional): paso para la aproximación; si es None se elige
+            automáticamente.
 
     Returns:
         float: aproximación de la k-ésima derivada.
     """
     if k == 0:
         return f(a)
-    elif k == 1:
-        # Primera derivada: diferencia central:
-        return (f(a + h) - f(a - h)) / (2 * h)
-    else:
-        # Derivadas de orden superior: recursivamente:
-        # f^(k)(a) ≈ [f^(k-1)(a+h) - f^(k-1)(a-h)] / (2h)
-        derivada_anterior_plus = aproximar_derivada_k(f, a + h, k - 1, h)
-        derivada_anterior_minus = aproximar_derivada_k(f, a - h, k - 1, h)
-        return (derivada_anterior_plus - derivada_anterior_minus) / (2 * h)
+    return aproximar_derivadas(f, a, k, h)[k]
 
 
 # Bloque de prueba:
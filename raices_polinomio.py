@@ -0,0 +1,142 @@
+"""
+Raices de polinomios: todas las raices complejas a la vez.
+Implementa la iteracion de Aberth-Ehrlich (simultanea para todas las raices)
+y los valores propios de la matriz companera. Ambas variantes aceptan lotes de
+polinomios del mismo grado y los resuelven de forma vectorizada con numpy.
+"""
+
+import numpy as np
+
+
+def _normalizar(coeficientes):
+    """Convierte los coeficientes a un arreglo 2D monico (una fila por polinomio).
+
+    Args:
+        coeficientes (array_like): coeficientes de mayor a menor grado; una fila
+            por polinomio si es 2D.
+
+    Returns:
+        numpy.ndarray: arreglo complejo de forma (lote, grado + 1) con coeficiente
+            principal 1.
+    """
+    c = np.atleast_2d(np.asarray(coeficientes, dtype=complex))
+    if c.shape[1] < 2:
+        raise ValueError("El polinomio debe tener grado al menos 1.")
+    if np.any(c[:, 0] == 0):
+        raise ValueError("El coeficiente principal no puede ser cero.")
+    return c / c[:, :1]
+
+
+def _horner(c, z):
+    """Evalua p(z) y p'(z) por Horner para cada polinomio (fila de c) en sus puntos z."""
+    p = np.broadcast_to(c[:, :1], z.shape).copy()
+    dp = np.zeros_like(z)
+    for k in range(1, c.shape[1]):
+        dp = dp * z + p
+        p = p * z + c[:, k:k + 1]
+    return p, dp
+
+
+def aberth(coeficientes, er=1e-14, n=100):
+    """Iteracion de Aberth-Ehrlich para todas las raices de uno o varios polinomios.
+
+    Args:
+        coeficientes (array_like): coeficientes de mayor a menor grado (2D para un lote).
+        er (float): cota del error relativo de cada raiz.
+        n (int): numero maximo de iteraciones.
+
+    Returns:
+        tuple: par `(raices, iteraciones)`; `raices` tiene forma (lote, grado).
+    """
+    c = _normalizar(coeficientes)
+    lote, grado = c.shape[0], c.shape[1] - 1
+
+    # Aproximaciones iniciales sobre un circulo de radio acotado por los coeficientes
+    # (el desfase del angulo evita simetrias con polinomios de coeficientes reales):
+    k = np.arange(1, grado + 1)
+    radio = np.max(np.abs(c[:, 1:]) ** (1.0 / k), axis=1)
+    radio = np.where(radio > 0, radio, 1.0)
+    angulos = 2 * np.pi * np.arange(grado) / grado + 0.4
+    z = radio[:, None] * np.exp(1j * angulos)[None, :]
+
+    activos = np.ones((lote, grado), dtype=bool)
+    diagonal = np.eye(grado, dtype=bool)
+    i = 0
+    while i < n and activos.any():
+        # Solo trabajamos con los polinomios que aun tienen raices sin converger:
+        filas = np.flatnonzero(activos.any(axis=1))
+        zf = z[filas]
+        p, dp = _horner(c[filas], zf)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            w = np.where(dp != 0, p / dp, 0)
+            diferencias = zf[:, :, None] - zf[:, None, :]
+            diferencias[:, diagonal] = np.inf
+            suma = np.sum(1 / diferencias, axis=2)
+            correccion = w / (1 - w * suma)
+        correccion = np.where(np.isfinite(correccion) & activos[filas], correccion, 0)
+        z[filas] = zf - correccion
+
+        escala = np.maximum(np.abs(z[filas]), 1.0)
+        activos[filas] &= (np.abs(correccion) > er * escala) & (p != 0)
+        i += 1
+
+    return np.sort(z, axis=1), i
+
+
+def matriz_companera(coeficientes):
+    """Raices como valores propios de la matriz companera de cada polinomio.
+
+    Args:
+        coeficientes (array_like): coeficientes de mayor a menor grado (2D para un lote).
+
+    Returns:
+        numpy.ndarray: raices de forma (lote, grado).
+    """
+    c = _normalizar(coeficientes)
+    lote, grado = c.shape[0], c.shape[1] - 1
+    companera = np.zeros((lote, grado, grado), dtype=complex)
+    companera[:, 0, :] = -c[:, 1:]
+    companera[:, np.arange(1, grado), np.arange(grado - 1)] = 1
+    return np.sort(np.linalg.eigvals(companera), axis=1)
+
+
+def raices_polinomio(coeficientes, metodo="aberth", er=1e-14, n=100):
+    """Calcula todas las raices complejas de uno o varios polinomios.
+
+    Args:
+        coeficientes (array_like): coeficientes de mayor a menor grado, por ejemplo
+            `[1, 0, -1, -1]` para x^3 - x - 1. Un arreglo 2D resuelve un lote de
+            polinomios del mismo grado (una fila por polinomio).
+        metodo (str): "aberth" o "companera".
+        er (float): cota del error relativo (solo Aberth).
+        n (int): numero maximo de iteraciones (solo Aberth).
+
+    Returns:
+        numpy.ndarray: raices complejas ordenadas; forma (grado,) para un polinomio
+            o (lote, grado) para un lote.
+    """
+    if metodo == "aberth":
+        raices, _ = aberth(coeficientes, er, n)
+    elif metodo == "companera":
+        raices = matriz_companera(coeficientes)
+    else:
+        raise ValueError("Método no reconocido. Use: 'aberth' o 'companera'.")
+    return raices[0] if np.ndim(coeficientes) == 1 else raices
+
+
+def raices_reales(coeficientes, tol=1e-9, metodo="aberth"):
+    """Raices reales de un polinomio (las raices complejas con parte imaginaria despreciable).
+
+    Args:
+        coeficientes (array_like): coeficientes de mayor a menor grado de un polinomio.
+        tol (float): tolerancia relativa sobre la parte imaginaria.
+        metodo (str): "aberth" o "companera".
+
+    Returns:
+        numpy.ndarray: raices reales ordenadas de menor a mayor.
+    """
+    if np.ndim(coeficientes) != 1:
+        raise ValueError("raices_reales recibe los coeficientes de un solo polinomio.")
+    raices = raices_polinomio(coeficientes, metodo)
+    reales = np.abs(raices.imag) <= tol * np.maximum(np.abs(raices), 1.0)
+    return np.sort(raices.real[reales])
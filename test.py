@@ -453,6 +453,448 @@ def run_tests_taylor(ejercicios, mostrar_proceso=False):
     return aprobados, len(ejercicios)
 
 
+# ---------------------------------------------------------------------------
+# Pruebas de los metodos avanzados (lotes, Brent, cuadraturas, cubatura, ...).
+# Cada prueba devuelve `(obtenido, esperado, tolerancia)`; las que necesitan
+# numpy o sympy se saltan si no estan instalados.
+# ---------------------------------------------------------------------------
+
+def _contador(f):
+    """Envuelve f contando sus llamadas en `g.llamadas`."""
+    def g(*args):
+        g.llamadas += 1
+        return f(*args)
+    g.llamadas = 0
+    return g
+
+
+def _prueba_biseccion_lote():
+    import numpy as np
+    c = np.array([2.0, 3.0, 5.0, 7.0])
+    raices, _, _ = biseccion.biseccion_lote(lambda x: x**2 - c, np.zeros(4), np.full(4, 3.0), 1e-12, 100)
+    return float(np.max(np.abs(raices - np.sqrt(c)))), 0.0, 1e-10
+
+
+def _prueba_biseccion_lote_extremos():
+    import numpy as np
+    # Raices de x(x - 1)(x - 0.5): en a, en b y en el primer punto medio.
+    raices, errores, iteraciones = biseccion.biseccion_lote(
+        lambda x: x * (x - 1) * (x - 0.5), [0.0, 0.7, 0.25], [0.3, 1.0, 0.75], 1e-12, 100)
+    desvio = float(np.sum(np.abs(raices - [0.0, 1.0, 0.5])) + np.sum(errores))
+    return desvio if list(iteraciones[:2]) == [0, 0] else math.inf, 0.0, 0.0
+
+
+def _prueba_brent_evaluaciones():
+    # Misma cantidad de evaluaciones que scipy.optimize.brentq en este problema:
+    f = _contador(lambda x: x**3 - 2*x - 5)
+    biseccion.brent(f, 2, 3, 1e-12, 100, mostrar_proceso=False)
+    return f.llamadas, 8, 0
+
+
+def _prueba_brent_raiz():
+    raiz, _ = biseccion.brent(lambda x: math.cos(x) - x, 0, 1, 1e-14, 100, mostrar_proceso=False)
+    return raiz, 0.7390851332151607, 1e-13
+
+
+def _prueba_buscar_raices():
+    import numpy as np
+    return len(biseccion.buscar_raices(np.sin, 0, 10)), 4, 0
+
+
+def _prueba_buscar_raices_extremo_entre_nodos():
+    # El minimo cae justo entre dos nodos (f igual en ambos): dos raices muy cercanas.
+    raices = biseccion.buscar_raices(lambda x: (x - 1.01)**2 - 1e-8, 0, 2, puntos=101, subdividir=1000)
+    return len(raices), 2, 0
+
+
+def _prueba_kseccion():
+    raiz, _ = biseccion.kseccion(lambda x: x**2 - 2, 0, 2, 1e-12, 100, k=4, mostrar_proceso=False)
+    return raiz, math.sqrt(2), 1e-10
+
+
+def _prueba_kseccion_raiz_en_extremo():
+    f = _contador(lambda x: x)
+    raiz, _ = biseccion.kseccion(f, 0, 1, 1e-12, 10, k=3, mostrar_proceso=False)
+    return raiz + f.llamadas, 0 + 2, 0
+
+
+def _prueba_newton_lote_estados():
+    import numpy as np
+    with np.errstate(all="ignore"):
+        _, _, _, estados = newton_raphson.newton_raphson_lote(
+            lambda x: x*x - 2, lambda x: 2*x, np.array([1.0, 0.0, -3.0, 1e300]), 1e-12, 50)
+    esperados = [newton_raphson.ESTADO_CONVERGIO, newton_raphson.ESTADO_DERIVADA_NULA,
+                 newton_raphson.ESTADO_CONVERGIO, newton_raphson.ESTADO_NO_FINITO]
+    return int(np.sum(estados != esperados)), 0, 0
+
+
+def _prueba_diferenciacion_automatica():
+    import diferenciacion_automatica as da
+    _, d = da.valor_y_derivada(lambda x: da.sin(x) * da.exp(x), 0.7)
+    return d, math.exp(0.7) * (math.sin(0.7) + math.cos(0.7)), 1e-14
+
+
+def _prueba_newton_sin_derivada():
+    import diferenciacion_automatica as da
+    raiz, _ = newton_raphson.newton_raphson(lambda x: da.exp(-x) - da.log(x), None, 1.2, 1e-12, 50,
+                                            mostrar_proceso=False)
+    return raiz, 1.3097995858041505, 1e-12
+
+
+def _prueba_newton_seguro():
+    # Newton puro diverge con atan desde x0 lejano; la version segura no sale de [a, b].
+    raiz, _ = newton_raphson.newton_seguro(math.atan, lambda x: 1 / (1 + x*x), -10, 20, 1e-12, 100,
+                                           mostrar_proceso=False)
+    return raiz, 0.0, 1e-12
+
+
+def _prueba_metodos_abiertos():
+    # Las cuatro estrategias deben converger a la misma raiz:
+    f = lambda x: x**3 - 2*x - 5
+    raices = [newton_raphson.metodo_abierto(f, 2.0, 1e-13, 50, metodo, df=lambda x: 3*x*x - 2,
+                                            d2f=lambda x: 6*x, mostrar_proceso=False)[0]
+              for metodo in newton_raphson.METODOS_ABIERTOS]
+    return max(abs(r - 2.0945514815423265) for r in raices), 0.0, 1e-12
+
+
+def _prueba_newton_usa_motor_comun():
+    # newton_raphson y metodo_abierto("newton") deben hacer exactamente las mismas evaluaciones:
+    f1 = _contador(lambda x: x**2 - 3)
+    f2 = _contador(lambda x: x**2 - 3)
+    newton_raphson.newton_raphson(f1, lambda x: 2*x, 1.0, 1e-12, 50, mostrar_proceso=False)
+    newton_raphson.metodo_abierto(f2, 1.0, 1e-12, 50, "newton", df=lambda x: 2*x, mostrar_proceso=False)
+    return f1.llamadas, f2.llamadas, 0
+
+
+def _prueba_raices_polinomio():
+    import numpy as np
+    import raices_polinomio
+    reales = raices_polinomio.raices_reales([1, -6, 11, -6])
+    return float(np.max(np.abs(reales - [1, 2, 3]))), 0.0, 1e-10
+
+
+def _prueba_companera():
+    import numpy as np
+    import raices_polinomio
+    raices = raices_polinomio.raices_polinomio([1, 0, 0, 1], metodo="companera")
+    return float(np.max(np.abs(raices**3 + 1))), 0.0, 1e-12
+
+
+def _prueba_continuacion():
+    import continuacion
+    parametros = [1 + 0.5 * k for k in range(20)]
+    raices, _, _ = continuacion.barrido_parametrico(lambda x, p: x*x - p, parametros, 1.0, 1e-12)
+    return max(abs(r - math.sqrt(p)) for r, p in zip(raices, parametros)), 0.0, 1e-10
+
+
+def _prueba_riemann_vectorizado():
+    import numpy as np
+    vectorizado = integracion.integrar(np.exp, 0, 1, 1000, vectorizar=True)
+    escalar = integracion.integrar(math.exp, 0, 1, 1000)
+    return vectorizado, escalar, 1e-12
+
+
+def _prueba_integracion_por_bloques():
+    import numpy as np
+    return integracion.integrar(np.sin, 0, math.pi, 10**5, tam_bloque=1000), 2.0, 1e-9
+
+
+def _prueba_integrar_adaptativo():
+    valor, _, _ = integracion.integrar_adaptativo(math.sqrt, 0, 1, tol=1e-10)
+    return valor, 2 / 3, 1e-9
+
+
+def _prueba_gauss_exactitud():
+    # La regla de 5 puntos es exacta para polinomios de grado 9:
+    return integracion.integrar(lambda x: x**9, 0, 1, n=1, metodo="gauss", orden=5), 0.1, 1e-15
+
+
+def _prueba_gauss_nodos():
+    nodos, pesos = integracion.nodos_gauss_legendre(3)
+    return nodos[2] + pesos[1], math.sqrt(3 / 5) + 8 / 9, 1e-15
+
+
+def _prueba_romberg():
+    romberg = integracion.Romberg(math.exp, 0, 1)
+    valor, _ = romberg.integrar_hasta(1e-12)
+    # Cada nivel reutiliza todos los puntos anteriores: 2^k + 1 evaluaciones.
+    reutiliza = romberg.evaluaciones == 2 ** (len(romberg.tabla) - 1) + 1
+    return valor if reutiliza else math.inf, math.e - 1, 1e-12
+
+
+def _prueba_paralelo_determinista():
+    # El resultado no depende del numero de trabajadores ni del tipo de ejecutor:
+    uno = integracion.integrar_paralelo("math:sin", 0, math.pi, 10**4, max_workers=1, ejecutor="hilos")
+    varios = integracion.integrar_paralelo("math:sin", 0, math.pi, 10**4, max_workers=4, ejecutor="hilos")
+    procesos = integracion.integrar_paralelo("math:sin", 0, math.pi, 10**4, max_workers=2)
+    return abs(uno - varios) + abs(uno - procesos), 0.0, 0.0
+
+
+def _prueba_simpson_irregular():
+    import numpy as np
+    # Espaciado irregular: la parabola por cada par de intervalos integra x^2 exactamente.
+    x = np.sort(np.concatenate([[0.0, 1.0], np.random.default_rng(0).random(40)]))
+    return integracion.simpson_muestras(x**2, x), 1 / 3, 1e-13
+
+
+def _prueba_muestras_mapeadas():
+    import os
+    import tempfile
+    import numpy as np
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "muestras.npy")
+        np.save(ruta, np.linspace(0, 1, 1001) ** 2)
+        y = integracion.cargar_muestras(ruta)
+        valor = integracion.trapecio_muestras(y, dx=0.001, tam_bloque=100)
+        del y
+    return valor, 1 / 3 + 1 / 6e6, 1e-12
+
+
+def _prueba_integrar_lote():
+    import numpy as np
+    p = np.array([1.0, 2.0, 3.0, 4.5])
+    valores = integracion.integrar_lote(lambda x, p: x**p, 0, 1, p, n=20, metodo="gauss")
+    return float(np.max(np.abs(valores - 1 / (p + 1)))), 0.0, 1e-12
+
+
+def _prueba_tanh_sinh_singular():
+    valor, _, _ = integracion.integrar_tanh_sinh(lambda x: 1 / math.sqrt(x), 0, 1)
+    return valor, 2.0, 1e-12
+
+
+def _prueba_tanh_sinh_infinito():
+    valor, _, _ = integracion.integrar_tanh_sinh(lambda x: 1 / (1 + x*x), -math.inf, math.inf)
+    return valor, math.pi, 1e-12
+
+
+def _prueba_tanh_sinh_error_honesto():
+    # El error estimado no puede quedar por debajo del error real:
+    valor, error, _ = integracion.integrar_tanh_sinh(lambda x: 1 / math.sqrt(1 - x*x), -1, 1)
+    con_distancia, _, _ = integracion.integrar_tanh_sinh(lambda x, d: 1 / math.sqrt(d * (2 - d)), -1, 1,
+                                                         con_distancia=True)
+    honesto = error >= abs(valor - math.pi)
+    return con_distancia if honesto else math.inf, math.pi, 1e-14
+
+
+def _prueba_cubatura_producto():
+    import numpy as np
+    import cubatura
+    f = lambda p: np.exp(-np.sum(p**2, axis=1))
+    exacto = (math.sqrt(math.pi) / 2 * math.erf(1)) ** 3
+    return cubatura.cubatura_producto(f, [(0, 1)] * 3, orden=6, tam_bloque=50), exacto, 1e-9
+
+
+def _prueba_sobol_direcciones():
+    import numpy as np
+    import cubatura
+    # Puntos 5 y 11 de scipy.stats.qmc.Sobol(10, scramble=False) (orden de Gray: 7 y 14 aqui):
+    referencia = {
+        7: [0.875, 0.875, 0.125, 0.375, 0.875, 0.625, 0.875, 0.375, 0.375, 0.125],
+        14: [0.4375, 0.5625, 0.1875, 0.6875, 0.8125, 0.0625, 0.6875, 0.6875, 0.6875, 0.0625],
+    }
+    puntos = cubatura.sobol(0, 16, 10)
+    return sum(int(np.sum(puntos[i] != v)) for i, v in referencia.items()), 0, 0
+
+
+def _prueba_cuasi_montecarlo():
+    import numpy as np
+    import cubatura
+    f = lambda p: np.exp(-np.sum(p**2, axis=1))
+    exacto = (math.sqrt(math.pi) / 2 * math.erf(1)) ** 6
+    valor, error = cubatura.cubatura_cuasi_montecarlo(f, [(0, 1)] * 6, muestras=2**12, semilla=1)
+    return valor, exacto, max(5 * error, 1e-4)
+
+
+def _prueba_integral_acumulada():
+    import numpy as np
+    F = integracion.integral_acumulada(np.exp, 0, 2, n=200)
+    return F(1.5), math.exp(1.5) - 1, 1e-8
+
+
+def _prueba_puntos_quiebre():
+    escalon = lambda x: 1.0 if x > 0.3 else 2.0
+    return integracion.integrar(escalon, 0, 1, 10, puntos_quiebre=[0.3]), 1.3, 1e-14
+
+
+def _prueba_detectar_saltos():
+    saltos = integracion.detectar_discontinuidades(lambda x: 1.0 if x > 0.3 else 0.0, 0, 1)
+    return saltos[0] if len(saltos) == 1 else math.inf, 0.3, 1e-10
+
+
+def _prueba_cache_derivadas():
+    import sympy as sp
+    x, y = sp.symbols("x y")
+    polinomio_taylor.derivadas_simbolicas(x * y**2, x, 3)
+    # Otra variable no puede reutilizar la cadena de x:
+    d = polinomio_taylor.derivadas_simbolicas(x * y**2, y, 1)[1]
+    return float(d.subs({x: 2, y: 3})), 12.0, 0
+
+
+def _prueba_puntos_quiebre_gauss():
+    # Cada tramo se integra con Gauss por defecto (exacto para x^2); izquierdo y
+    # derecho se rechazan porque evaluarian f justo sobre el punto de quiebre.
+    f = lambda x: x * x if x < 0.3 else 2 * x * x
+    valor = integracion.integrar(f, 0, 1, 10, puntos_quiebre=[0.3])
+    try:
+        integracion.integrar(f, 0, 1, 10, metodo="izquierdo", puntos_quiebre=[0.3])
+    except ValueError:
+        return valor, 0.009 + 2 * (1 - 0.027) / 3, 1e-14
+    return math.inf, 0.0, 0.0
+
+
+def _prueba_taylor_simbolico_cache():
+    import sympy as sp
+    x = sp.Symbol("x")
+    polinomio_taylor.polinomio_taylor(sp.sin(x), 0, 9, 0.5, mostrar_proceso=False)
+    calculadas = sum(len(c) for c in polinomio_taylor._CACHE_DERIVADAS.values())
+    valor, _ = polinomio_taylor.polinomio_taylor(sp.sin(x), 0, 5, 0.5, mostrar_proceso=False)
+    # El grado 5 reutiliza la cadena del grado 9 sin derivar de nuevo:
+    nuevas = sum(len(c) for c in polinomio_taylor._CACHE_DERIVADAS.values()) - calculadas
+    return valor if nuevas == 0 else math.inf, 0.479427083333333, 1e-12
+
+
+def _prueba_polinomio_taylor_objeto():
+    import numpy as np
+    import sympy as sp
+    P, _ = polinomio_taylor.polinomio_taylor(sp.exp(sp.Symbol("x")), 0, 12, mostrar_proceso=False)
+    z = np.linspace(-1, 1, 1001)
+    error = np.max(np.abs(P(z) - np.exp(z))) + abs(P.derivada()(0.5) - math.exp(0.5))
+    error += abs(P.integral_definida(0, 1) - (math.e - 1))
+    return float(error), 0.0, 1e-8
+
+
+def _prueba_taylor_simbolico_exacto():
+    import sympy as sp
+    x, k = sp.symbols("x k")
+    # Coeficientes con un parametro simbolico: se devuelve la expresion exacta.
+    expr, _ = polinomio_taylor.polinomio_taylor(sp.exp(k * x), 0, 3, mostrar_proceso=False)
+    fallos = int(sp.simplify(expr - (1 + k*x + k**2 * x**2 / 2 + k**3 * x**3 / 6)) != 0)
+    # Centro exacto pi/4: la expresion se arma con pi, no con su valor float.
+    P, _ = polinomio_taylor.polinomio_taylor(sp.sin(x), sp.pi / 4, 3, mostrar_proceso=False)
+    serie = sum(sp.diff(sp.sin(x), x, j).subs(x, sp.pi / 4) / sp.factorial(j) * (x - sp.pi / 4)**j for j in range(4))
+    fallos += int(sp.simplify(P.expr - serie) != 0) + int(sp.simplify(P.derivada().expr - sp.diff(serie, x)) != 0)
+    return fallos, 0, 0
+
+
+def _prueba_pesos_fornberg():
+    # Plantillas clasicas: [1, -2, 1] para f'' y [1, -4, 6, -4, 1] para f''''.
+    segunda = polinomio_taylor._pesos_fornberg([-1, 0, 1], 2)[2]
+    cuarta = polinomio_taylor._pesos_fornberg([-2, -1, 0, 1, 2], 4)[4]
+    diferencia = sum(abs(w - v) for w, v in zip(segunda + cuarta, [1, -2, 1, 1, -4, 6, -4, 1]))
+    return float(diferencia), 0.0, 0
+
+
+def _prueba_derivadas_compartidas():
+    f = _contador(math.exp)
+    derivadas = polinomio_taylor.aproximar_derivadas(f, 0.3, 6)
+    desplazamientos, _ = polinomio_taylor.plantilla_diferencias(6)
+    error = max(abs(d - math.exp(0.3)) / math.factorial(k) for k, d in enumerate(derivadas))
+    # Una sola evaluacion de f por nodo de la plantilla:
+    return error if f.llamadas == len(desplazamientos) else math.inf, 0.0, 1e-6
+
+
+def _prueba_taylor_cerca_del_dominio():
+    import sympy as sp
+    x = sp.Symbol("x")
+    # La plantilla no debe salir del dominio de f (sqrt y log cerca de 0):
+    casos = [(math.sqrt, sp.sqrt(x), 0.1, 3, 0.12), (math.log, sp.log(x), 0.2, 4, 0.25),
+             (math.log, sp.log(x), 1.0, 10, 1.3)]
+    error = 0.0
+    for f, f_simbolica, a, n, x_eval in casos:
+        numerico, _ = polinomio_taylor.polinomio_taylor(f, a, n, x_eval, mostrar_proceso=False)
+        exacto, _ = polinomio_taylor.polinomio_taylor(f_simbolica, a, n, x_eval, mostrar_proceso=False)
+        error = max(error, abs(numerico / exacto - 1))
+    return error, 0.0, 1e-5
+
+
+def _prueba_taylor_centro_grande():
+    import sympy as sp
+    # El paso no se escala con |a|: con a = 100 las diferencias siguen siendo precisas.
+    numerico, _ = polinomio_taylor.polinomio_taylor(math.exp, 100, 3, 100.1, mostrar_proceso=False)
+    exacto, _ = polinomio_taylor.polinomio_taylor(sp.exp(sp.Symbol("x")), 100, 3, 100.1, mostrar_proceso=False)
+    return numerico / exacto, 1.0, 1e-10
+
+
+# (nombre, prueba, requisitos)
+PRUEBAS_AVANZADAS = [
+    ("biseccion_lote: sqrt(c) para un lote", _prueba_biseccion_lote, ("numpy",)),
+    ("biseccion_lote: raices en los extremos", _prueba_biseccion_lote_extremos, ("numpy",)),
+    ("brent: evaluaciones de f (como brentq)", _prueba_brent_evaluaciones, ()),
+    ("brent: cos(x) - x", _prueba_brent_raiz, ()),
+    ("buscar_raices: sin(x) en [0, 10]", _prueba_buscar_raices, ("numpy",)),
+    ("buscar_raices: extremo entre dos nodos", _prueba_buscar_raices_extremo_entre_nodos, ("numpy",)),
+    ("kseccion: x^2 - 2 con k=4", _prueba_kseccion, ()),
+    ("kseccion: raiz en el extremo a", _prueba_kseccion_raiz_en_extremo, ()),
+    ("newton_raphson_lote: codigos de estado", _prueba_newton_lote_estados, ("numpy",)),
+    ("diferenciacion automatica: (sin x e^x)'", _prueba_diferenciacion_automatica, ()),
+    ("newton_raphson sin derivada (df=None)", _prueba_newton_sin_derivada, ()),
+    ("newton_seguro: atan(x) en [-10, 20]", _prueba_newton_seguro, ()),
+    ("metodo_abierto: newton/halley/secante/steffensen", _prueba_metodos_abiertos, ()),
+    ("newton_raphson usa el motor comun", _prueba_newton_usa_motor_comun, ()),
+    ("raices_reales: (x-1)(x-2)(x-3)", _prueba_raices_polinomio, ("numpy",)),
+    ("raices_polinomio: matriz companera x^3 + 1", _prueba_companera, ("numpy",)),
+    ("barrido_parametrico: x^2 - p", _prueba_continuacion, ()),
+    ("integrar vectorizado = escalar", _prueba_riemann_vectorizado, ("numpy",)),
+    ("integrar por bloques (n = 1e5)", _prueba_integracion_por_bloques, ("numpy",)),
+    ("integrar_adaptativo: sqrt(x)", _prueba_integrar_adaptativo, ()),
+    ("gauss: exacta hasta grado 2*orden-1", _prueba_gauss_exactitud, ()),
+    ("nodos_gauss_legendre(3)", _prueba_gauss_nodos, ()),
+    ("Romberg: reutiliza evaluaciones", _prueba_romberg, ()),
+    ("integrar_paralelo: identico bit a bit", _prueba_paralelo_determinista, ()),
+    ("simpson_muestras: espaciado irregular", _prueba_simpson_irregular, ("numpy",)),
+    ("trapecio_muestras sobre archivo mapeado", _prueba_muestras_mapeadas, ("numpy",)),
+    ("integrar_lote: x^p", _prueba_integrar_lote, ("numpy",)),
+    ("tanh-sinh: 1/sqrt(x) en [0, 1]", _prueba_tanh_sinh_singular, ()),
+    ("tanh-sinh: 1/(1+x^2) en (-inf, inf)", _prueba_tanh_sinh_infinito, ()),
+    ("tanh-sinh: error honesto y con_distancia", _prueba_tanh_sinh_error_honesto, ()),
+    ("cubatura_producto: exp(-|x|^2) en [0,1]^3", _prueba_cubatura_producto, ("numpy",)),
+    ("sobol: numeros de direccion (10 dim)", _prueba_sobol_direcciones, ("numpy",)),
+    ("cuasi-Monte Carlo: exp(-|x|^2) en [0,1]^6", _prueba_cuasi_montecarlo, ("numpy",)),
+    ("integral_acumulada: e^x", _prueba_integral_acumulada, ("numpy",)),
+    ("integrar con puntos_quiebre", _prueba_puntos_quiebre, ()),
+    ("detectar_discontinuidades: salto en 0.3", _prueba_detectar_saltos, ()),
+    ("puntos_quiebre: Gauss por tramo, sin izquierdo/derecho", _prueba_puntos_quiebre_gauss, ()),
+    ("derivadas_simbolicas: cache por variable", _prueba_cache_derivadas, ("sympy",)),
+    ("polinomio_taylor: reutiliza la cadena", _prueba_taylor_simbolico_cache, ("sympy",)),
+    ("PolinomioTaylor: Horner, derivada, integral", _prueba_polinomio_taylor_objeto, ("numpy", "sympy")),
+    ("polinomio_taylor: coeficientes y centro exactos", _prueba_taylor_simbolico_exacto, ("sympy",)),
+    ("_pesos_fornberg: plantillas clasicas", _prueba_pesos_fornberg, ("sympy",)),
+    ("aproximar_derivadas: una plantilla compartida", _prueba_derivadas_compartidas, ("sympy",)),
+    ("polinomio_taylor numerico: cerca del dominio", _prueba_taylor_cerca_del_dominio, ("sympy",)),
+    ("polinomio_taylor numerico: centro a = 100", _prueba_taylor_centro_grande, ("sympy",)),
+]
+
+
+def run_tests_avanzados(pruebas, mostrar_proceso=False):
+    """Ejecuta las pruebas de los metodos avanzados; salta las que no tienen sus dependencias."""
+    print("\n" + "=" * 60)
+    print("TESTS - METODOS AVANZADOS")
+    print("=" * 60)
+
+    aprobados = 0
+    total = 0
+    for num, (nombre, prueba, requisitos) in enumerate(pruebas, 1):
+        faltantes = [r for r in requisitos if importlib.util.find_spec(r) is None]
+        if "sympy" in requisitos and polinomio_taylor is None:
+            faltantes.append("polinomio-de-taylor")
+        if faltantes:
+            print(f"  [SALTADO] #{num} {nombre} (requiere {', '.join(faltantes)})")
+            continue
+        total += 1
+        try:
+            obtenido, esperado, tolerancia = prueba()
+            error = abs(obtenido - esperado)
+            ok = error <= tolerancia
+            simbolo = "OK" if ok else "FALLO"
+            print(f"  [{simbolo}] #{num} {nombre} | obt={obtenido:.6g} | esp~{esperado:.6g} | error={error:.2e}")
+            if ok:
+                aprobados += 1
+        except Exception as e:
+            print(f"  [FALLO] #{num} {nombre} - Excepcion: {str(e)[:80]}")
+
+    return aprobados, total
+
+
 def main():
     mostrar = "--verbose" in sys.argv or "-v" in sys.argv
 
@@ -475,6 +917,7 @@ def main():
     total_ok = 0
     total_tests = 0
     b_ok, b_tot, n_ok, n_tot, r_ok, r_tot, t_ok, t_tot = 0, 0, 0, 0, 0, 0, 0, 0
+    a_ok, a_tot = 0, 0
 
     if ej_biseccion:
         b_ok, b_tot = run_tests_biseccion(ej_biseccion, mostrar_proceso=mostrar)
@@ -504,6 +947,10 @@ def main():
     else:
         print("\n  No se cargaron ejercicios de Taylor.")
 
+    a_ok, a_tot = run_tests_avanzados(PRUEBAS_AVANZADAS, mostrar_proceso=mostrar)
+    total_ok += a_ok
+    total_tests += a_tot
+
     print("\n" + "=" * 60)
     print("RESUMEN")
     print("=" * 60)
@@ -515,6 +962,7 @@ def main():
         print(f"  Riemann:        {r_ok}/{r_tot} aprobados")
     if ej_taylor and polinomio_taylor:
         print(f"  Taylor:         {t_ok}/{t_tot} aprobados")
+    print(f"  Avanzados:      {a_ok}/{a_tot} aprobados")
     print(f"  TOTAL:          {total_ok}/{total_tests} aprobados")
     print("=" * 60)
 